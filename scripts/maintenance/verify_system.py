@@ -5,6 +5,7 @@ Quick health check and status verification
 """
 import os
 import sys
+from operator import itemgetter
 from pathlib import Path
 
 
@@ -205,7 +206,7 @@ def main():
     print("📊 Verification Summary:")
     print("=" * 50)
 
-    passed = sum(1 for _, result in results if result)
+    passed = sum(map(itemgetter(1), results))
     total = len(results)
 
     for check_name, result in results:
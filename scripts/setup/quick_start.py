@@ -63,12 +63,14 @@ def setup_environment():
 
     try:
         # Create .env file with mock mode
-        with open(".env", "w", encoding="utf-8") as f:
-            f.write("# O-RAN × Nephio RAG System Configuration\n")
-            f.write("API_MODE=mock\n")
-            f.write("LOG_LEVEL=INFO\n")
-            f.write("VECTOR_DB_PATH=./oran_nephio_vectordb\n")
-            f.write("CHUNK_SIZE=1024\n")
+        env_lines = [
+            "# O-RAN × Nephio RAG System Configuration",
+            "API_MODE=mock",
+            "LOG_LEVEL=INFO",
+            "VECTOR_DB_PATH=./oran_nephio_vectordb",
+            "CHUNK_SIZE=1024",
+        ]
+        Path(".env").write_text("\n".join(env_lines) + "\n", encoding="utf-8")
 
         print("✅ Environment configuration created (.env)")
         return True
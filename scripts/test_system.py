@@ -8,6 +8,7 @@ import logging
 import os
 import sys
 from datetime import datetime
+from operator import itemgetter
 from typing import Dict, List, Tuple
 
 # 添加父目錄到路徑
@@ -261,21 +262,21 @@ def test_file_permissions() -> List[Tuple[str, bool, str]]:
 
 
 def print_test_results(test_name: str, tests: List[Tuple[str, bool, str]]):
-    """打印測試結果"""
-    print(f"\n🔍 {test_name}")
-    print("-" * 50)
+    """打印測試結果 (整段組合後一次輸出)"""
+    lines = [f"\n🔍 {test_name}", "-" * 50]
 
     passed = 0
     total = len(tests)
 
     for name, result, message in tests:
         status = "✅" if result else "❌"
-        print(f"{status} {name:<25} {message}")
+        lines.append(f"{status} {name:<25} {message}")
         if result:
             passed += 1
 
     success_rate = (passed / total * 100) if total > 0 else 0
-    print(f"\n通過率: {passed}/{total} ({success_rate:.1f}%)")
+    lines.append(f"\n通過率: {passed}/{total} ({success_rate:.1f}%)")
+    print("\n".join(lines))
 
     return passed, total
 
@@ -294,7 +295,7 @@ def generate_test_report(all_results: Dict[str, List[Tuple[str, bool, str]]]) ->
     total_tests = 0
 
     for category, results in all_results.items():
-        passed = sum(1 for _, result, _ in results if result)
+        passed = sum(map(itemgetter(1), results))
         total = len(results)
         success_rate = (passed / total * 100) if total > 0 else 0
 
@@ -336,35 +337,25 @@ def main():
     all_results = {}
 
     try:
-        # 1. 測試 Python 環境
-        env_tests = test_python_environment()
-        passed, total = print_test_results("Python 環境測試", env_tests)
-        all_results["Python 環境"] = env_tests
-
-        # 2. 測試套件導入
-        import_tests = test_package_imports()
-        passed, total = print_test_results("套件導入測試", import_tests)
-        all_results["套件導入"] = import_tests
-
-        # 3. 測試檔案權限
-        permission_tests = test_file_permissions()
-        passed, total = print_test_results("檔案權限測試", permission_tests)
-        all_results["檔案權限"] = permission_tests
-
-        # 4. 測試系統模組
-        module_tests = test_system_modules()
-        passed, total = print_test_results("系統模組測試", module_tests)
-        all_results["系統模組"] = module_tests
-
-        # 5. 測試文件載入器
-        loader_tests = test_document_loader()
-        passed, total = print_test_results("文件載入器測試", loader_tests)
-        all_results["文件載入器"] = loader_tests
+        # 1-5. 依序執行各類別測試
+        category_runs = [
+            ("Python 環境測試", "Python 環境", test_python_environment),
+            ("套件導入測試", "套件導入", test_package_imports),
+            ("檔案權限測試", "檔案權限", test_file_permissions),
+            ("系統模組測試", "系統模組", test_system_modules),
+            ("文件載入器測試", "文件載入器", test_document_loader),
+        ]
+        for title, category, test_func in category_runs:
+            category_tests = test_func()
+            print_test_results(title, category_tests)
+            all_results[category] = category_tests
+
+        module_tests = all_results["系統模組"]
 
         # 6. 測試 RAG 系統（如果前面的測試基本通過）
-        if sum(result for _, result, _ in module_tests) >= len(module_tests) * 0.8:
+        if sum(map(itemgetter(1), module_tests)) >= len(module_tests) * 0.8:
             rag_tests = test_rag_system_basic()
-            passed, total = print_test_results("RAG 系統測試", rag_tests)
+            print_test_results("RAG 系統測試", rag_tests)
             all_results["RAG 系統"] = rag_tests
         else:
             print("\n⚠️  由於系統模組測試失敗較多，跳過 RAG 系統測試")
@@ -384,7 +375,7 @@ def main():
             print(f"\n⚠️  無法儲存測試報告: {e}")
 
         # 決定退出碼
-        total_passed = sum(sum(1 for _, result, _ in results if result) for results in all_results.values())
+        total_passed = sum(sum(map(itemgetter(1), results)) for results in all_results.values())
         total_tests = sum(len(results) for results in all_results.values())
         success_rate = (total_passed / total_tests * 100) if total_tests > 0 else 0
 
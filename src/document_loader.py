@@ -96,7 +96,15 @@ class DocumentContentCleaner:
         """清理 HTML 內容，提取主要文字"""
         try:
             soup = BeautifulSoup(html_content, "html.parser")
+        except Exception as e:
+            logger.error(f"HTML 清理失敗: {e}")
+            return ""
 
+        return self.clean_soup(soup, base_url)
+
+    def clean_soup(self, soup: BeautifulSoup, base_url: str = "") -> str:
+        """清理已解析的 HTML 樹並提取主要文字 (會就地修改傳入的樹，重複使用時請傳入副本)"""
+        try:
             # 移除註解
             for comment in soup.find_all(string=lambda text: isinstance(text, Comment)):
                 comment.extract()
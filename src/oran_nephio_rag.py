@@ -93,9 +93,8 @@ class SklearnTfidfEmbeddings:
 
         try:
             tfidf_matrix = self.vectorizer.transform(texts)
-            # 轉換稀疏矩陣為密集列表
-            dense_matrix = tfidf_matrix.toarray()
-            return [row.tolist() for row in dense_matrix]
+            # 轉換稀疏矩陣為密集列表 (整批一次轉換)
+            return tfidf_matrix.toarray().tolist()
         except Exception as e:
             logger.error(f"❌ TF-IDF 嵌入失敗: {e}")
             # 回退到簡單特徵
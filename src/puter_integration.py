@@ -43,20 +43,22 @@ class PuterClaudeAdapter:
 
     AVAILABLE_MODELS = ["claude-sonnet-4", "claude-opus-4", "claude-sonnet-3.7", "claude-sonnet-3.5"]
 
-    def __init__(self, model: str = "claude-sonnet-4", headless: bool = True) -> None:
+    def __init__(self, model: str = "claude-sonnet-4", headless: bool = True, driver: Optional[Any] = None) -> None:
         """
         Initialize Puter.js adapter with browser automation
 
         Args:
             model: Claude model to use
             headless: Whether to run browser in headless mode
+            driver: Optional pre-started WebDriver to reuse across sessions (caller keeps ownership)
         """
         if model not in self.AVAILABLE_MODELS:
             raise ValueError(f"Model {model} not supported. Available: {self.AVAILABLE_MODELS}")
 
         self.model = model
         self.headless = headless
-        self.driver: Optional[Any] = None  # webdriver.Chrome type
+        self.driver: Optional[Any] = driver  # webdriver.Chrome type
+        self._owns_driver = driver is None
         self.mock_mode = API_MODE == "mock"
 
         if self.mock_mode:
@@ -216,20 +218,24 @@ class PuterClaudeAdapter:
     def _browser_session(self) -> Generator[None, None, None]:
         """Context manager for browser session"""
         try:
-            # Setup Chrome options
-            options = Options()
-            if self.headless:
-                options.add_argument("--headless")
-            options.add_argument("--no-sandbox")
-            options.add_argument("--disable-dev-shm-usage")
-            options.add_argument("--disable-gpu")
-            options.add_argument("--window-size=1920,1080")
-
-            # Initialize driver
-            service = Service(ChromeDriverManager().install())
-            self.driver = webdriver.Chrome(service=service, options=options)
-            if self.driver is not None:
-                self.driver.implicitly_wait(10)
+            if self._owns_driver:
+                # Setup Chrome options
+                options = Options()
+                if self.headless:
+                    options.add_argument("--headless")
+                options.add_argument("--no-sandbox")
+                options.add_argument("--disable-dev-shm-usage")
+                options.add_argument("--disable-gpu")
+                options.add_argument("--window-size=1920,1080")
+
+                # Initialize driver
+                service = Service(ChromeDriverManager().install())
+                self.driver = webdriver.Chrome(service=service, options=options)
+                if self.driver is not None:
+                    self.driver.implicitly_wait(10)
+            else:
+                # Reuse the shared driver, isolating this session from the previous one
+                self.driver.delete_all_cookies()
 
             # Create temporary HTML file
             with tempfile.NamedTemporaryFile(mode="w", suffix=".html", delete=False) as f:
@@ -254,7 +260,13 @@ class PuterClaudeAdapter:
             raise
         finally:
             if self.driver:
-                self.driver.quit()
+                if self._owns_driver:
+                    self.driver.quit()
+                else:
+                    try:
+                        self.driver.get("about:blank")
+                    except Exception as e:
+                        logger.warning(f"Failed to reset shared browser session: {e}")
             # Clean up temp file
             try:
                 os.unlink(html_file)
@@ -0,0 +1,53 @@
+"""
+Lazy imports of the LLM adapter modules and API mode helpers shared by the API-mode and Puter.js tests
+"""
+
+import os
+import socket
+from contextlib import contextmanager
+from functools import lru_cache
+from typing import Iterator
+from urllib.parse import urlsplit
+
+import pytest
+
+# Local model endpoint used when LOCAL_MODEL_URL is not set (the default documented in API_MODES_GUIDE.md)
+DEFAULT_LOCAL_MODEL_URL = "http://localhost:11434"
+
+
+@lru_cache(maxsize=None)
+def get_adapters():
+    """Import api_adapters and Config on first use; skip the calling test if they are not importable"""
+    api_adapters = pytest.importorskip("api_adapters")
+    config = pytest.importorskip("config")
+    return api_adapters, config.Config
+
+
+@contextmanager
+def env(key: str, value: str) -> Iterator[None]:
+    """Temporarily set an environment variable through monkeypatch; the previous value is restored on exit"""
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setenv(key, value)
+        yield
+
+
+def tcp_probe(url: str, timeout: float = 0.2) -> bool:
+    """Quickly check whether the host/port behind a URL accepts connections"""
+    parsed = urlsplit(url)
+    if not parsed.hostname:
+        return False
+    port = parsed.port or (443 if parsed.scheme == "https" else 80)
+    try:
+        with socket.create_connection((parsed.hostname, port), timeout=timeout):
+            return True
+    except OSError:
+        return False
+
+
+def mode_feasible(mode: str) -> bool:
+    """Rule out obviously unavailable modes before building an adapter"""
+    if mode == "anthropic":
+        return bool(os.environ.get("ANTHROPIC_API_KEY"))
+    if mode == "local":
+        return tcp_probe(os.environ.get("LOCAL_MODEL_URL") or DEFAULT_LOCAL_MODEL_URL)
+    return True
@@ -0,0 +1,39 @@
+"""
+Deterministic hash-based vectors shared by the DummyEmbeddings fallbacks in the TF-IDF fix scripts
+"""
+
+import hashlib
+from typing import List
+
+try:
+    import numpy as np
+
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+
+# Byte value -> float in [-1.0, 1.0), used when NumPy is missing
+_HEX2F = [(i / 128.0) - 1.0 for i in range(256)]
+
+
+def digest16(text: str) -> bytes:
+    """16 bytes spread from text; only determinism matters, so use blake2b rather than md5"""
+    return hashlib.blake2b(text.encode("utf-8"), digest_size=16).digest()
+
+
+def hash_vectors(texts: List[str], dimension: int) -> List[List[float]]:
+    """One vector per text: its digest scaled to [-1.0, 1.0) in the first 16 slots, zeros after"""
+    if NUMPY_AVAILABLE:
+        # Stack all digests into one (N, 16) uint8 array and scale it in a single vectorized step
+        digests = np.frombuffer(b"".join(digest16(text) for text in texts), dtype=np.uint8).reshape(len(texts), 16)
+        width = min(16, dimension)
+        vectors = np.zeros((len(texts), dimension), dtype=np.float32)
+        vectors[:, :width] = digests[:, :width] / 128.0 - 1.0
+        return vectors.tolist()
+
+    vectors = []
+    for text in texts:
+        vector = [_HEX2F[b] for b in digest16(text)[:dimension]]
+        vector.extend([0.0] * (dimension - len(vector)))
+        vectors.append(vector)
+    return vectors
@@ -0,0 +1,12 @@
+"""
+Import helpers shared by the API tests
+"""
+
+import sys
+from importlib import import_module
+
+
+def cached_import(module_name, item_name):
+    """Return item_name from module_name, importing the module only if it is not loaded yet"""
+    module = sys.modules.get(module_name) or import_module(module_name)
+    return getattr(module, item_name)
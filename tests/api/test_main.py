@@ -2,17 +2,36 @@
 Tests for the main API application
 """
 
+from contextlib import asynccontextmanager
+
 import pytest
 from fastapi.testclient import TestClient
 
+from tests.api._imports import cached_import
+
+# Keep this module on one worker under "pytest -n auto --dist loadgroup"
+pytestmark = pytest.mark.xdist_group("api_main")
+
 
-@pytest.fixture
+@asynccontextmanager
+async def _no_startup(app):
+    """Lifespan stand-in: these tests exercise the routes, never the RAG system startup"""
+    yield
+
+
+@pytest.fixture(scope="session")
 def client():
-    """Create test client"""
-    from src.api.main import create_app
+    """Create test client once; these tests only read from the app"""
+    create_app = cached_import("src.api.main", "create_app")
 
     app = create_app()
-    return TestClient(app)
+    app.router.lifespan_context = _no_startup
+    # Build the OpenAPI schema up front; FastAPI memoizes it, so /openapi.json, /docs and /redoc reuse it
+    app.openapi()
+
+    # Entering the client keeps one event loop portal open for every request instead of one per request
+    with TestClient(app) as test_client:
+        yield test_client
 
 
 class TestMainAPI:
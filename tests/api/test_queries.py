@@ -3,41 +3,64 @@ Tests for query endpoints
 """
 
 import pytest
+from collections import namedtuple
 from fastapi.testclient import TestClient
 from unittest.mock import Mock, patch
 
+from tests.api._imports import cached_import
 
-@pytest.fixture
-def client():
-    """Create test client with mocked RAG system"""
-    from src.api.main import create_app
 
-    app = create_app()
+# Keep this module on one worker under "pytest -n auto --dist loadgroup"
+pytestmark = pytest.mark.xdist_group("api_queries")
+
 
-    # Mock the RAG system
+@pytest.fixture(scope="session")
+def api_app():
+    """Build the app and its test client once; tests swap in their own RAG mock via client"""
+    create_app = cached_import("src.api.main", "create_app")
+
+    app = create_app()
+    return app, TestClient(app)
+
+
+# Canned RAG payloads, built once; the query routers only read from them
+_MOCK_ANSWER = {
+    "success": True,
+    "answer": "Test answer",
+    "sources": [
+        {
+            "content": "Test content",
+            "metadata": {"source_type": "nephio", "url": "https://example.com"},
+            "similarity_score": 0.9,
+        }
+    ],
+    "context_used": 1,
+    "retrieval_scores": [0.9],
+    "generation_method": "test",
+    "constraint_compliant": True,
+}
+# Document stub exposing the two attributes the search router reads
+_Doc = namedtuple("_Doc", ["page_content", "metadata"])
+_MOCK_DOC = _Doc("Test content", {"source_type": "nephio"})
+
+
+def _mock_rag_system():
+    """Ready RAG system mock returning one Nephio source"""
     mock_rag = Mock()
     mock_rag.is_ready = True
-    mock_rag.query.return_value = {
-        "success": True,
-        "answer": "Test answer",
-        "sources": [
-            {
-                "content": "Test content",
-                "metadata": {"source_type": "nephio", "url": "https://example.com"},
-                "similarity_score": 0.9,
-            }
-        ],
-        "context_used": 1,
-        "retrieval_scores": [0.9],
-        "generation_method": "test",
-        "constraint_compliant": True,
-    }
-    mock_rag.vector_manager.search_similar.return_value = [
-        (Mock(page_content="Test content", metadata={"source_type": "nephio"}), 0.9)
-    ]
+    mock_rag.query.return_value = _MOCK_ANSWER
+    mock_rag.vector_manager.search_similar.return_value = [(_MOCK_DOC, 0.9)]
+    return mock_rag
 
-    app.state.rag_system = mock_rag
-    return TestClient(app)
+
+@pytest.fixture
+def client(api_app):
+    """Shared test client with a fresh mocked RAG system for each test"""
+    app, test_client = api_app
+    previous = getattr(app.state, "rag_system", None)
+    app.state.rag_system = _mock_rag_system()
+    yield test_client
+    app.state.rag_system = previous
 
 
 class TestQueryEndpoints:
@@ -85,24 +108,17 @@ class TestQueryEndpoints:
         assert "sources" in data
         assert len(data["sources"]) == 0
 
-    def test_empty_query(self, client):
-        """Test empty query validation"""
-        query_data = {"query": ""}
-
-        response = client.post("/api/v1/query/", json=query_data)
-        assert response.status_code == 422  # Validation error
-
-    def test_long_query(self, client):
-        """Test very long query validation"""
-        query_data = {"query": "x" * 1001}  # Exceeds max length
-
-        response = client.post("/api/v1/query/", json=query_data)
-        assert response.status_code == 422  # Validation error
-
-    def test_invalid_k_parameter(self, client):
-        """Test invalid k parameter"""
-        query_data = {"query": "Test", "k": 25}  # Exceeds max k
-
+    @pytest.mark.parametrize(
+        "query_data",
+        [
+            {"query": ""},
+            {"query": "x" * 1001},  # Exceeds max length
+            {"query": "Test", "k": 25},  # Exceeds max k
+        ],
+        ids=["empty_query", "long_query", "invalid_k_parameter"],
+    )
+    def test_query_validation(self, client, query_data):
+        """Test that invalid query payloads are rejected"""
         response = client.post("/api/v1/query/", json=query_data)
         assert response.status_code == 422  # Validation error
 
@@ -174,7 +190,7 @@ class TestQueryErrors:
 
     def test_rag_system_not_available(self):
         """Test behavior when RAG system is not available"""
-        from src.api.main import create_app
+        create_app = cached_import("src.api.main", "create_app")
 
         app = create_app()
         app.state.rag_system = None  # No RAG system
@@ -186,7 +202,7 @@ class TestQueryErrors:
 
     def test_rag_system_not_ready(self):
         """Test behavior when RAG system is not ready"""
-        from src.api.main import create_app
+        create_app = cached_import("src.api.main", "create_app")
 
         app = create_app()
 
@@ -5,14 +5,59 @@ Comprehensive mocking for all external services and dependencies
 
 import importlib
 import os
-import shutil
-import tempfile
+import sys
 import time
-from typing import Any, Dict, Generator
+from contextlib import ExitStack
+from functools import lru_cache
+from pathlib import Path
+from types import SimpleNamespace
+from typing import Any, Dict
 from unittest.mock import MagicMock, patch
 
 import pytest
 import responses
+from langchain.docstore.document import Document
+
+# Put src on sys.path once for the whole session (same string the test modules use, so their guards dedupe)
+SRC_DIR = os.path.join(os.path.dirname(__file__), "..", "src")
+if SRC_DIR not in sys.path:
+    sys.path.insert(0, SRC_DIR)
+
+# Attribute surfaces of the mocked vector stores and Puter adapter, so a typo'd name fails instead of returning a mock
+VECTORDB_SPEC = [
+    "similarity_search_with_score",
+    "similarity_search",
+    "add_documents",
+    "delete",
+    "persist",
+    "save",
+    "load",
+    "documents",
+    "as_retriever",
+    "_collection",
+]
+CHROMA_SPEC = [
+    "similarity_search_with_score",
+    "similarity_search",
+    "add_documents",
+    "add_texts",
+    "delete",
+    "persist",
+    "get",
+    "as_retriever",
+    "_client",
+    "_collection",
+]
+PUTER_ADAPTER_SPEC = [
+    "model",
+    "headless",
+    "driver",
+    "AVAILABLE_MODELS",
+    "query",
+    "is_available",
+    "get_available_models",
+    "get_info",
+]
 
 # Mock API key for all tests
 TEST_API_KEY = "test-anthropic-api-key-12345"
@@ -22,6 +67,53 @@ TEST_VECTOR_DB_PATH = "./test_vectordb"
 TEST_COLLECTION_NAME = "test_collection"
 TEST_MODEL_NAME = "claude-sonnet-4"
 TEST_EMBEDDINGS_DIM = 384
+# API_MODE is pinned to mock for the whole run (pytest_configure, reset_config)
+TEST_ADAPTER_TYPE = "puter_js_mock"
+
+# HTML payloads for the HTTP mocks, built once at import
+_TEST1_HTML = """
+            <html>
+            <head><title>Test Doc 1</title></head>
+            <body>
+                <main>
+                    <h1>Nephio Overview</h1>
+                    <p>Nephio is a cloud native network automation platform.</p>
+                    <p>It helps manage network functions at scale.</p>
+                </main>
+            </body>
+            </html>
+            """
+
+_TEST2_HTML = """
+            <html>
+            <head><title>Test Doc 2</title></head>
+            <body>
+                <article>
+                    <h1>O-RAN Integration</h1>
+                    <p>O-RAN provides open interfaces for radio access networks.</p>
+                    <p>Integration with Nephio enables automated O-RAN deployments.</p>
+                </article>
+            </body>
+            </html>
+            """
+
+_SESSION_HTML_BYTES = (
+    b"<html><body><h1>Test Content</h1><p>Mock response content with test content for Nephio and additional details "
+    b"to meet minimum length requirements for content validation. This content should be long enough to pass the "
+    b"100-byte minimum requirement.</p></body></html>"
+)
+_SESSION_HTML_TEXT = _SESSION_HTML_BYTES.decode("utf-8")
+
+
+# Static HTML pages for sample_html_documents, stored under tests/fixtures/<name>.html
+FIXTURE_DIR = Path(__file__).parent / "fixtures"
+SAMPLE_HTML_DOCUMENTS = ("nephio_architecture", "oran_integration", "minimal_content", "no_main_content")
+
+
+@lru_cache(maxsize=None)
+def _html(file_name: str) -> str:
+    """Read an HTML fixture file once per session"""
+    return (FIXTURE_DIR / file_name).read_text(encoding="utf-8")
 
 
 # Guard function to prevent API_MODE changes during tests
@@ -35,124 +127,83 @@ def prevent_api_mode_change(new_value):
         )
 
 
-@pytest.fixture(scope="session", autouse=True)
-def enforce_test_environment():
-    """Enforce consistent test environment settings for entire session"""
-    # Store original values
-    original_api_mode = os.getenv("API_MODE")
-    original_api_key = os.getenv("ANTHROPIC_API_KEY")
+# Environment variables that affect config; restored after every test
+ENV_VARS_TO_TRACK = [
+    "ANTHROPIC_API_KEY",
+    "API_MODE",
+    "BROWSER_HEADLESS",
+    "BROWSER_TIMEOUT",
+    "BROWSER_WAIT_TIME",
+    "PUTER_MODEL",
+    "CLAUDE_MODEL",
+    "CLAUDE_TEMPERATURE",
+    "VECTOR_DB_PATH",
+    "EMBEDDINGS_CACHE_PATH",
+    "LOG_LEVEL",
+]
 
-    # Set test environment
-    os.environ["API_MODE"] = "mock"
-    os.environ["ANTHROPIC_API_KEY"] = TEST_API_KEY
-
-    try:
-        yield {"API_MODE": "mock", "ANTHROPIC_API_KEY": TEST_API_KEY}
-    finally:
-        # Restore original values only if they existed
-        if original_api_mode is not None:
-            os.environ["API_MODE"] = original_api_mode
-        else:
-            os.environ.pop("API_MODE", None)
-
-        if original_api_key is not None:
-            os.environ["ANTHROPIC_API_KEY"] = original_api_key
-        else:
-            os.environ.pop("ANTHROPIC_API_KEY", None)
+# Modules that read configuration at import time
+CONFIG_MODULES = ["src.config", "src.document_loader", "src.oran_nephio_rag", "src.oran_nephio_rag_fixed"]
 
 
 @pytest.fixture(scope="session", autouse=True)
-def mock_anthropic_api():
-    """Mock Anthropic API key for all tests"""
-    with patch.dict(os.environ, {"ANTHROPIC_API_KEY": TEST_API_KEY}):
-        yield TEST_API_KEY
+def enforce_test_environment():
+    """Enforce consistent test environment settings for entire session"""
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setenv("API_MODE", "mock")
+        mp.setenv("ANTHROPIC_API_KEY", TEST_API_KEY)
+        yield {"API_MODE": "mock", "ANTHROPIC_API_KEY": TEST_API_KEY}
 
 
 @pytest.fixture(autouse=True)
-def reset_config():
-    """Reset configuration between tests to prevent state leakage"""
-    import sys
-
-    # Store original environment variables that might affect config
-    original_env = {}
-    env_vars_to_track = [
-        "ANTHROPIC_API_KEY",
-        "API_MODE",
-        "BROWSER_HEADLESS",
-        "BROWSER_TIMEOUT",
-        "BROWSER_WAIT_TIME",
-        "PUTER_MODEL",
-        "CLAUDE_MODEL",
-        "CLAUDE_TEMPERATURE",
-        "VECTOR_DB_PATH",
-        "EMBEDDINGS_CACHE_PATH",
-        "LOG_LEVEL",
-    ]
-
-    for var in env_vars_to_track:
+def reset_config(monkeypatch):
+    """Reset configuration environment between tests to prevent state leakage"""
+    # Snapshot the tracked variables so monkeypatch restores them after the test,
+    # even if the test writes os.environ directly
+    for var in ENV_VARS_TO_TRACK:
         if var in os.environ:
-            original_env[var] = os.environ[var]
+            monkeypatch.setenv(var, os.environ[var])
+        else:
+            monkeypatch.delenv(var, raising=False)
 
     # CRITICAL: Set API_MODE to 'mock' for all tests to ensure consistency
     # This prevents adapter type mismatches and cross-test interference
-    os.environ["API_MODE"] = "mock"
+    monkeypatch.setenv("API_MODE", "mock")
+    monkeypatch.setenv("ANTHROPIC_API_KEY", TEST_API_KEY)
 
     yield
 
-    # After each test, clean up any module imports and reload config
-    modules_to_reload = ["src.config", "src.document_loader", "src.oran_nephio_rag", "src.oran_nephio_rag_fixed"]
 
-    for module_name in modules_to_reload:
+@pytest.fixture
+def fresh_config():
+    """Opt-in: reload the config-dependent modules after the test so the next import sees a fresh Config"""
+    yield
+
+    for module_name in CONFIG_MODULES:
         if module_name in sys.modules:
             try:
                 importlib.reload(sys.modules[module_name])
             except Exception:
                 # If reload fails, remove from modules to force fresh import
-                try:
-                    del sys.modules[module_name]
-                except KeyError:
-                    pass
-
-    # Clear any cached instances or global state that might interfere
-    try:
-        import gc
-
-        gc.collect()  # Force garbage collection to clear any cached instances
-    except Exception:
-        pass
-
-    # Restore original environment (but keep TEST_API_KEY for session and API_MODE as mock)
-    for var in env_vars_to_track:
-        if var == "ANTHROPIC_API_KEY":
-            continue  # Keep the test API key
-        if var == "API_MODE":
-            # Always keep API_MODE as mock for test stability
-            os.environ["API_MODE"] = "mock"
-            continue
-        if var in original_env:
-            os.environ[var] = original_env[var]
-        elif var in os.environ:
-            del os.environ[var]
+                sys.modules.pop(module_name, None)
 
 
-@pytest.fixture
-def temp_dir() -> Generator[str, None, None]:
-    """Create temporary directory for tests"""
-    temp_path = tempfile.mkdtemp()
-    yield temp_path
-    shutil.rmtree(temp_path, ignore_errors=True)
+@pytest.fixture(scope="session")
+def mock_config_dir(tmp_path_factory):
+    """One directory for the mocked config paths, shared by the whole session"""
+    return str(tmp_path_factory.mktemp("mock_cfg"))
 
 
 @pytest.fixture
-def mock_config(temp_dir):
-    """Mock configuration with test settings"""
+def mock_config(mock_config_dir):
+    """Mock configuration with test settings (paths are never written, so they share one session directory)"""
     with patch("src.config.Config") as mock_config_class:
         mock_config = MagicMock()
         mock_config.ANTHROPIC_API_KEY = TEST_API_KEY
-        mock_config.VECTOR_DB_PATH = os.path.join(temp_dir, "test_vectordb")
+        mock_config.VECTOR_DB_PATH = os.path.join(mock_config_dir, "test_vectordb")
         mock_config.COLLECTION_NAME = TEST_COLLECTION_NAME
-        mock_config.EMBEDDINGS_CACHE_PATH = os.path.join(temp_dir, "test_embeddings")
-        mock_config.LOG_FILE = os.path.join(temp_dir, "test.log")
+        mock_config.EMBEDDINGS_CACHE_PATH = os.path.join(mock_config_dir, "test_embeddings")
+        mock_config.LOG_FILE = os.path.join(mock_config_dir, "test.log")
         mock_config.LOG_LEVEL = "DEBUG"
         mock_config.CLAUDE_MODEL = "claude-3-sonnet-20240229"
         mock_config.CLAUDE_MAX_TOKENS = 1000
@@ -178,26 +229,59 @@ def mock_config(temp_dir):
         yield mock_config
 
 
+@pytest.fixture(scope="session")
+def rag_config():
+    """Single Config instance shared by tests that only read configuration"""
+    from src.config import Config
+
+    return Config()
+
+
+@pytest.fixture(scope="session")
+def rag_system(rag_config):
+    """Single ORANNephioRAG instance shared across the session (construction is the expensive part)"""
+    from src.oran_nephio_rag import ORANNephioRAG
+
+    return ORANNephioRAG(rag_config)
+
+
+@pytest.fixture(scope="session")
+def content_cleaner(rag_config):
+    """Single DocumentContentCleaner shared across the session"""
+    from src.document_loader import DocumentContentCleaner
+
+    return DocumentContentCleaner(rag_config)
+
+
+@pytest.fixture(scope="session")
+def document_loader(rag_config):
+    """Single DocumentLoader shared across the session"""
+    from src.document_loader import DocumentLoader
+
+    return DocumentLoader(rag_config)
+
+
 @pytest.fixture
 def mock_vectordb():
     """Mock vector database for testing"""
-    mock_db = MagicMock()
+    mock_db = MagicMock(spec=VECTORDB_SPEC)
     mock_db.similarity_search_with_score.return_value = [
         (
-            MagicMock(
+            SimpleNamespace(
                 page_content="Nephio is a Kubernetes-based cloud native intent automation platform.",
                 metadata={"source": "https://docs.nephio.org/test1", "type": "nephio"},
             ),
             0.9,
         ),
         (
-            MagicMock(
+            SimpleNamespace(
                 page_content="O-RAN provides open interfaces and architecture for RAN.",
                 metadata={"source": "https://docs.nephio.org/test2", "type": "nephio"},
             ),
             0.8,
         ),
     ]
+    mock_db._collection = MagicMock(spec=["count"])
     mock_db._collection.count.return_value = 100
     return mock_db
 
@@ -214,8 +298,6 @@ def mock_embeddings():
 @pytest.fixture
 def sample_documents():
     """Sample documents for testing"""
-    from langchain.docstore.document import Document
-
     return [
         Document(
             page_content="Nephio is a Kubernetes-based cloud native intent automation platform designed to help service providers deploy and manage complex network functions across large scale edge deployments.",
@@ -273,33 +355,11 @@ def mock_http_responses():
     responses_data = {
         "https://docs.nephio.org/test1": {
             "status_code": 200,
-            "content": """
-            <html>
-            <head><title>Test Doc 1</title></head>
-            <body>
-                <main>
-                    <h1>Nephio Overview</h1>
-                    <p>Nephio is a cloud native network automation platform.</p>
-                    <p>It helps manage network functions at scale.</p>
-                </main>
-            </body>
-            </html>
-            """,
+            "content": _TEST1_HTML,
         },
         "https://docs.nephio.org/test2": {
             "status_code": 200,
-            "content": """
-            <html>
-            <head><title>Test Doc 2</title></head>
-            <body>
-                <article>
-                    <h1>O-RAN Integration</h1>
-                    <p>O-RAN provides open interfaces for radio access networks.</p>
-                    <p>Integration with Nephio enables automated O-RAN deployments.</p>
-                </article>
-            </body>
-            </html>
-            """,
+            "content": _TEST2_HTML,
         },
     }
     return responses_data
@@ -310,39 +370,69 @@ def mock_http_responses():
 # ============================================================================
 
 
-@pytest.fixture
-def mock_selenium_webdriver():
-    """Mock Selenium WebDriver for Puter.js browser automation"""
-    mock_driver = MagicMock()
+# Session-scoped mocks, keyed by fixture name: (mock, configure function)
+_SESSION_MOCKS: Dict[str, Any] = {}
+
+
+def _session_mock(name: str, configure, spec=None) -> MagicMock:
+    """Build a MagicMock once per session and register it for per-test reset"""
+    mock_obj = MagicMock(spec=spec)
+    configure(mock_obj)
+    _SESSION_MOCKS[name] = (mock_obj, configure)
+    return mock_obj
 
+
+@pytest.fixture(autouse=True)
+def reset_session_mocks(request):
+    """Reset the session-scoped mocks a test uses, so call history and overrides never leak between tests"""
+    for name in request.fixturenames:
+        entry = _SESSION_MOCKS.get(name)
+        if entry is None:
+            continue
+        mock_obj, configure = entry
+        # reset_mock 會清掉 return_value / side_effect，所以重新套用預設設定
+        mock_obj.reset_mock(return_value=True, side_effect=True)
+        configure(mock_obj)
+    yield
+
+
+# Mock JavaScript execution results for Puter.js, checked in order by substring
+_JS_RESPONSES = (
+    ("typeof puter !== 'undefined'", True),
+    ("typeof puter.ai !== 'undefined'", True),
+    ("window.ragProcessing", False),  # Not processing
+    (
+        "window.ragResponse",
+        {
+            "answer": "Mock response from Puter.js Claude integration",
+            "model": "claude-sonnet-4",
+            "timestamp": "2024-01-15T10:30:00Z",
+            "success": True,
+        },
+    ),
+    ("window.ragError", None),
+)
+
+
+def _mock_js_execution(script):
+    """Mock JavaScript execution results for Puter.js"""
+    return next((result for needle, result in _JS_RESPONSES if needle in script), None)
+
+
+def _configure_selenium_webdriver(mock_driver):
     # Mock WebDriver methods
     mock_driver.get = MagicMock()
     mock_driver.quit = MagicMock()
     mock_driver.execute_script = MagicMock()
     mock_driver.implicitly_wait = MagicMock()
 
-    # Mock JavaScript execution results for Puter.js
-    def mock_js_execution(script):
-        if "typeof puter !== 'undefined'" in script:
-            return True
-        elif "typeof puter.ai !== 'undefined'" in script:
-            return True
-        elif "window.ragProcessing" in script:
-            return False  # Not processing
-        elif "window.ragResponse" in script:
-            return {
-                "answer": "Mock response from Puter.js Claude integration",
-                "model": "claude-sonnet-4",
-                "timestamp": "2024-01-15T10:30:00Z",
-                "success": True,
-            }
-        elif "window.ragError" in script:
-            return None
-        return None
+    mock_driver.execute_script.side_effect = _mock_js_execution
 
-    mock_driver.execute_script.side_effect = mock_js_execution
 
-    return mock_driver
+@pytest.fixture(scope="session")
+def mock_selenium_webdriver():
+    """Mock Selenium WebDriver for Puter.js browser automation"""
+    return _session_mock("mock_selenium_webdriver", _configure_selenium_webdriver)
 
 
 @pytest.fixture
@@ -353,13 +443,7 @@ def mock_webdriver_manager():
         yield mock_manager
 
 
-@pytest.fixture
-def mock_puter_adapter():
-    """Mock PuterClaudeAdapter for browser automation testing"""
-    import os
-
-    mock_adapter = MagicMock()
-
+def _configure_puter_adapter(mock_adapter):
     # Mock adapter properties
     mock_adapter.model = TEST_MODEL_NAME
     mock_adapter.headless = True
@@ -393,15 +477,16 @@ def mock_puter_adapter():
         "selenium_available": api_mode != "mock",
     }
 
-    return mock_adapter
 
+@pytest.fixture(scope="session")
+def mock_puter_adapter():
+    """Mock PuterClaudeAdapter for browser automation testing"""
+    return _session_mock("mock_puter_adapter", _configure_puter_adapter, spec=PUTER_ADAPTER_SPEC)
 
-@pytest.fixture
-def mock_chromadb():
-    """Comprehensive ChromaDB mock for vector database operations"""
 
+def _configure_chromadb(mock_chroma):
     # Mock collection
-    mock_collection = MagicMock()
+    mock_collection = mock_chroma._collection
     mock_collection.name = TEST_COLLECTION_NAME
     mock_collection.count.return_value = 150
 
@@ -431,33 +516,30 @@ def mock_chromadb():
     mock_collection.get.return_value = mock_query_result
 
     # Mock client
-    mock_client = MagicMock()
+    mock_client = mock_chroma._client
     mock_client.get_collection.return_value = mock_collection
     mock_client.get_or_create_collection.return_value = mock_collection
     mock_client.list_collections.return_value = [mock_collection]
     mock_client.delete_collection.return_value = None
 
     # Mock Chroma class
-    mock_chroma = MagicMock()
-    mock_chroma._client = mock_client
-    mock_chroma._collection = mock_collection
     mock_chroma.similarity_search_with_score.return_value = [
         (
-            MagicMock(
+            SimpleNamespace(
                 page_content="Nephio is a Kubernetes-based cloud native intent automation platform.",
                 metadata={"source": "https://docs.nephio.org/architecture", "type": "nephio"},
             ),
             0.9,
         ),
         (
-            MagicMock(
+            SimpleNamespace(
                 page_content="O-RAN provides open interfaces and architecture for RAN disaggregation.",
                 metadata={"source": "https://docs.nephio.org/o-ran", "type": "nephio"},
             ),
             0.8,
         ),
         (
-            MagicMock(
+            SimpleNamespace(
                 page_content="Network Function scaling involves both horizontal and vertical scaling strategies.",
                 metadata={"source": "https://docs.nephio.org/scaling", "type": "nephio"},
             ),
@@ -467,14 +549,14 @@ def mock_chromadb():
     mock_chroma.add_documents.return_value = None
     mock_chroma.delete.return_value = None
 
-    return mock_chroma
 
+@pytest.fixture(scope="session")
+def mock_chromadb():
+    """Comprehensive ChromaDB mock for vector database operations"""
+    return _session_mock("mock_chromadb", _configure_chromadb, spec=CHROMA_SPEC)
 
-@pytest.fixture
-def mock_huggingface_embeddings():
-    """Mock HuggingFace embeddings model"""
-    mock_embeddings = MagicMock()
 
+def _configure_huggingface_embeddings(mock_embeddings):
     # Mock embeddings with consistent dimensions - using Mock objects for assertion support
     mock_embeddings.embed_documents = MagicMock(
         side_effect=lambda texts: [[0.1 + i * 0.01] * TEST_EMBEDDINGS_DIM for i in range(len(texts))]
@@ -485,20 +567,20 @@ def mock_huggingface_embeddings():
     mock_embeddings.model_name = "sentence-transformers/all-MiniLM-L6-v2"
     mock_embeddings.cache_folder = "./test_embeddings_cache"
 
-    return mock_embeddings
 
+@pytest.fixture(scope="session")
+def mock_huggingface_embeddings():
+    """Mock HuggingFace embeddings model"""
+    return _session_mock("mock_huggingface_embeddings", _configure_huggingface_embeddings)
 
-@pytest.fixture
-def mock_requests_session():
-    """Mock requests Session for HTTP operations"""
-    mock_session = MagicMock()
 
+def _configure_requests_session(mock_session):
     # Mock successful response
     mock_response = MagicMock()
     mock_response.status_code = 200
     mock_response.headers = {"content-type": "text/html; charset=utf-8"}
-    mock_response.content = b"<html><body><h1>Test Content</h1><p>Mock response content with test content for Nephio and additional details to meet minimum length requirements for content validation. This content should be long enough to pass the 100-byte minimum requirement.</p></body></html>"
-    mock_response.text = mock_response.content.decode("utf-8")
+    mock_response.content = _SESSION_HTML_BYTES
+    mock_response.text = _SESSION_HTML_TEXT
     mock_response.url = "https://test.example.com/doc"
     mock_response.encoding = "utf-8"
     mock_response.raise_for_status = MagicMock()
@@ -508,26 +590,30 @@ def mock_requests_session():
     mock_session.max_redirects = 5
     mock_session.close = MagicMock()
 
-    return mock_session
 
+@pytest.fixture(scope="session")
+def mock_requests_session():
+    """Mock requests Session for HTTP operations"""
+    return _session_mock("mock_requests_session", _configure_requests_session)
 
-@pytest.fixture
-def mock_anthropic_client():
-    """Mock Anthropic Claude API client (fallback for non-Puter integrations)"""
-    mock_client = MagicMock()
 
+def _configure_anthropic_client(mock_client):
     # Mock message response
     mock_message = MagicMock()
-    mock_message.content = [MagicMock(text="Mock Claude response based on provided context.")]
+    mock_message.content = [SimpleNamespace(text="Mock Claude response based on provided context.")]
     mock_message.id = "msg_test_123"
     mock_message.model = "claude-3-sonnet-20240229"
     mock_message.role = "assistant"
     mock_message.stop_reason = "end_turn"
-    mock_message.usage = MagicMock(input_tokens=100, output_tokens=50)
+    mock_message.usage = SimpleNamespace(input_tokens=100, output_tokens=50)
 
     mock_client.messages.create.return_value = mock_message
 
-    return mock_client
+
+@pytest.fixture(scope="session")
+def mock_anthropic_client():
+    """Mock Anthropic Claude API client (fallback for non-Puter integrations)"""
+    return _session_mock("mock_anthropic_client", _configure_anthropic_client)
 
 
 # ============================================================================
@@ -535,7 +621,7 @@ def mock_anthropic_client():
 # ============================================================================
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def mock_full_rag_system(mock_chromadb, mock_huggingface_embeddings, mock_puter_adapter):
     """Complete RAG system mock with all external dependencies"""
     return {"vectordb": mock_chromadb, "embeddings": mock_huggingface_embeddings, "llm_adapter": mock_puter_adapter}
@@ -547,7 +633,7 @@ def mock_browser_environment(mock_selenium_webdriver, mock_webdriver_manager):
     return {"webdriver": mock_selenium_webdriver, "webdriver_manager": mock_webdriver_manager}
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def mock_http_environment(mock_requests_session):
     """Complete HTTP environment mock for document loading"""
     return {"session": mock_requests_session}
@@ -561,45 +647,43 @@ def mock_http_environment(mock_requests_session):
 @pytest.fixture
 def sample_rag_query():
     """Sample RAG query for testing"""
-    return {
+    query = {
         "question": "How do I scale O-RAN network functions using Nephio?",
         "expected_keywords": ["scale", "o-ran", "nephio", "network function"],
         "context_docs": 3,
         "min_response_length": 100,
     }
+    return query
 
 
 @pytest.fixture
 def sample_puter_responses():
     """Sample Puter.js API responses for different scenarios"""
-    # Determine adapter type based on current API_MODE (should be 'mock' in tests)
-    api_mode = os.getenv("API_MODE", "mock")  # Default to mock for tests
-    adapter_type = "puter_js_mock" if api_mode == "mock" else "puter_js_browser"
-
-    return {
+    responses_data = {
         "success": {
             "success": True,
             "answer": "To scale O-RAN network functions using Nephio, you need to create a ProvisioningRequest CRD with the desired replica count and resource constraints.",
             "model": "claude-sonnet-4",
             "timestamp": "2024-01-15T10:30:00Z",
-            "adapter_type": adapter_type,
+            "adapter_type": TEST_ADAPTER_TYPE,
             "query_time": 2.1,
             "streamed": False,
         },
         "error": {
             "success": False,
             "error": "Browser session failed to initialize",
-            "adapter_type": adapter_type,
+            "adapter_type": TEST_ADAPTER_TYPE,
             "timestamp": "2024-01-15T10:30:00Z",
         },
-        "timeout": {"success": False, "error": "Query timed out after 60 seconds", "adapter_type": adapter_type},
+        "timeout": {"success": False, "error": "Query timed out after 60 seconds", "adapter_type": TEST_ADAPTER_TYPE},
     }
+    return responses_data
 
 
 @pytest.fixture
 def sample_vector_search_results():
     """Sample vector database search results"""
-    return {
+    results = {
         "high_similarity": [
             {
                 "content": "Nephio uses Kubernetes operators to manage network function lifecycle and scaling.",
@@ -627,6 +711,7 @@ def sample_vector_search_results():
             }
         ],
     }
+    return results
 
 
 @pytest.fixture
@@ -634,7 +719,7 @@ def sample_document_sources():
     """Extended sample document sources for testing"""
     from src.config import DocumentSource
 
-    return {
+    sources = {
         "valid_sources": [
             DocumentSource(
                 url="https://docs.nephio.org/architecture",
@@ -677,82 +762,19 @@ def sample_document_sources():
             )
         ],
     }
+    return sources
 
 
 @pytest.fixture
 def sample_html_documents():
     """Sample HTML documents with various content types"""
-    return {
-        "nephio_architecture": """
-        <!DOCTYPE html>
-        <html>
-        <head>
-            <title>Nephio Architecture Overview</title>
-            <meta name="description" content="Comprehensive guide to Nephio architecture">
-        </head>
-        <body>
-            <nav><a href="/">Home</a></nav>
-            <main class="content">
-                <h1>Nephio Architecture</h1>
-                <p>Nephio is a Kubernetes-based cloud native intent automation platform designed for telecom network management.</p>
-                <h2>Core Components</h2>
-                <ul>
-                    <li>Porch for configuration management</li>
-                    <li>Nephio Controllers for automation</li>
-                    <li>Resource Backend for inventory</li>
-                </ul>
-                <h2>Scaling Strategies</h2>
-                <p>Network functions can be scaled horizontally using replica sets and vertically by adjusting resource limits.</p>
-            </main>
-            <footer>Copyright 2024</footer>
-        </body>
-        </html>
-        """,
-        "oran_integration": """
-        <!DOCTYPE html>
-        <html>
-        <head>
-            <title>O-RAN Integration with Nephio</title>
-        </head>
-        <body>
-            <article>
-                <h1>O-RAN Network Function Integration</h1>
-                <p>This guide covers the integration of O-RAN network functions with Nephio for automated deployment and scaling.</p>
-                <section>
-                    <h2>Scale-out Procedures</h2>
-                    <p>To scale out O-RAN components:</p>
-                    <ol>
-                        <li>Create ProvisioningRequest CRD</li>
-                        <li>Specify target cluster and resource requirements</li>
-                        <li>Apply scaling policies</li>
-                    </ol>
-                    <code>kubectl apply -f scaling-config.yaml</code>
-                </section>
-            </article>
-        </body>
-        </html>
-        """,
-        "minimal_content": """
-        <html><body><p>Short content</p></body></html>
-        """,
-        "no_main_content": """
-        <!DOCTYPE html>
-        <html>
-        <head><title>Navigation Only</title></head>
-        <body>
-            <nav>Main navigation</nav>
-            <header>Site header</header>
-            <footer>Site footer</footer>
-        </body>
-        </html>
-        """,
-    }
+    return {name: _html(f"{name}.html") for name in SAMPLE_HTML_DOCUMENTS}
 
 
 @pytest.fixture
 def mock_claude_response():
     """Mock Claude API response for testing"""
-    return {
+    response = {
         "content": [
             {
                 "text": "Based on the provided documentation, Nephio is a Kubernetes-based cloud native intent automation platform that helps service providers deploy and manage network functions. For O-RAN scale-out, you would typically use Nephio's intent-driven automation to deploy additional O-RAN components across edge locations.",
@@ -767,6 +789,7 @@ def mock_claude_response():
         "type": "message",
         "usage": {"input_tokens": 100, "output_tokens": 150},
     }
+    return response
 
 
 # ============================================================================
@@ -774,6 +797,24 @@ def mock_claude_response():
 # ============================================================================
 
 
+# (module, attribute) pairs patched by mock_all_external_services, in the order of its return values
+EXTERNAL_SERVICE_TARGETS = (
+    ("src.puter_integration", "PuterClaudeAdapter"),
+    ("selenium.webdriver", "Chrome"),
+    ("webdriver_manager.chrome", "ChromeDriverManager"),
+    ("chromadb", "Client"),
+    ("langchain.vectorstores", "Chroma"),
+    ("langchain.embeddings", "HuggingFaceEmbeddings"),
+    ("requests", "Session"),
+)
+
+
+@lru_cache(maxsize=None)
+def _external_service_modules():
+    """Resolve the patch target modules once (on first use, so src is imported with API_MODE=mock)"""
+    return tuple(importlib.import_module(module_name) for module_name, _ in EXTERNAL_SERVICE_TARGETS)
+
+
 @pytest.fixture
 def mock_all_external_services(
     mock_chromadb,
@@ -784,20 +825,21 @@ def mock_all_external_services(
     mock_requests_session,
 ):
     """Context manager that mocks all external services at once"""
-    patches = [
-        patch("src.puter_integration.PuterClaudeAdapter", return_value=mock_puter_adapter),
-        patch("selenium.webdriver.Chrome", return_value=mock_selenium_webdriver),
-        patch("webdriver_manager.chrome.ChromeDriverManager", return_value=mock_webdriver_manager),
-        patch("chromadb.Client", return_value=mock_chromadb._client),
-        patch("langchain.vectorstores.Chroma", return_value=mock_chromadb),
-        patch("langchain.embeddings.HuggingFaceEmbeddings", return_value=mock_huggingface_embeddings),
-        patch("requests.Session", return_value=mock_requests_session),
-    ]
+    return_values = (
+        mock_puter_adapter,
+        mock_selenium_webdriver,
+        mock_webdriver_manager,
+        mock_chromadb._client,
+        mock_chromadb,
+        mock_huggingface_embeddings,
+        mock_requests_session,
+    )
 
-    started_patches = []
-    try:
-        for p in patches:
-            started_patches.append(p.start())
+    with ExitStack() as stack:
+        for module, (_, attribute), return_value in zip(
+            _external_service_modules(), EXTERNAL_SERVICE_TARGETS, return_values
+        ):
+            stack.enter_context(patch.object(module, attribute, return_value=return_value))
         yield {
             "puter_adapter": mock_puter_adapter,
             "llm_adapter": mock_puter_adapter,
@@ -807,38 +849,12 @@ def mock_all_external_services(
             "session": mock_requests_session,
             "webdriver": mock_selenium_webdriver,
         }
-    finally:
-        for p in started_patches:
-            try:
-                p.stop()
-            except RuntimeError:
-                pass  # Already stopped
-
-
-@pytest.fixture(autouse=True)
-def cleanup_test_files():
-    """Cleanup test files after each test"""
-    yield
-    # Clean up any test files that might have been created
-    test_patterns = ["test_*.log", "test_vectordb*", "test_embeddings*", "test_*.html", "chromedriver*"]
-
-    import glob
-
-    for pattern in test_patterns:
-        for file_path in glob.glob(pattern):
-            try:
-                if os.path.isfile(file_path):
-                    os.remove(file_path)
-                elif os.path.isdir(file_path):
-                    shutil.rmtree(file_path, ignore_errors=True)
-            except Exception:
-                pass  # Ignore cleanup errors
 
 
 @pytest.fixture
 def mock_system_status():
     """Mock system status for testing"""
-    return {
+    status = {
         "vectordb_ready": True,
         "qa_chain_ready": True,
         "total_sources": 10,
@@ -853,6 +869,7 @@ def mock_system_status():
             "last_query": "2024-01-15T10:25:00",
         },
     }
+    return status
 
 
 # ============================================================================
@@ -887,16 +904,12 @@ def assert_log_contains(log_file: str, message: str):
 
 def mock_puter_query_success(prompt: str, **kwargs) -> Dict[str, Any]:
     """Helper to create successful Puter.js query responses"""
-    # Determine adapter type based on current API_MODE
-    api_mode = os.getenv("API_MODE", "mock")  # Default to mock for tests
-    adapter_type = "puter_js_mock" if api_mode == "mock" else "puter_js_browser"
-
     return {
         "success": True,
         "answer": f"Mock response for: {prompt[:50]}...",
         "model": TEST_MODEL_NAME,
         "timestamp": time.strftime("%Y-%m-%dT%H:%M:%SZ"),
-        "adapter_type": adapter_type,
+        "adapter_type": TEST_ADAPTER_TYPE,
         "query_time": 1.5,
         "streamed": kwargs.get("stream", False),
     }
@@ -904,14 +917,10 @@ def mock_puter_query_success(prompt: str, **kwargs) -> Dict[str, Any]:
 
 def mock_puter_query_error(error_message: str) -> Dict[str, Any]:
     """Helper to create error Puter.js query responses"""
-    # Determine adapter type based on current API_MODE
-    api_mode = os.getenv("API_MODE", "mock")  # Default to mock for tests
-    adapter_type = "puter_js_mock" if api_mode == "mock" else "puter_js_browser"
-
     return {
         "success": False,
         "error": error_message,
-        "adapter_type": adapter_type,
+        "adapter_type": TEST_ADAPTER_TYPE,
         "timestamp": time.strftime("%Y-%m-%dT%H:%M:%SZ"),
     }
 
@@ -933,12 +942,15 @@ def create_mock_document(content: str, source_url: str, doc_type: str = "nephio"
 def setup_responses_mock(responses_data: Dict[str, Dict[str, Any]]):
     """Helper to setup responses mock with multiple URLs"""
     for url, response_config in responses_data.items():
+        # A fresh Response per registration, so call_count never carries over between tests
         responses.add(
-            responses.GET,
-            url,
-            body=response_config.get("content", ""),
-            status=response_config.get("status_code", 200),
-            content_type=response_config.get("content_type", "text/html"),
+            responses.Response(
+                responses.GET,
+                url,
+                body=response_config.get("content", ""),
+                status=response_config.get("status_code", 200),
+                content_type=response_config.get("content_type", "text/html"),
+            )
         )
 
 
@@ -9,74 +9,75 @@ import sys
 import time
 from typing import Any, Dict
 
-# 確保可以導入本地模組
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), "src"))
+from tests._adapters import env, get_adapters, mode_feasible
 
-try:
-    from api_adapters import LLMManager, create_llm_manager, quick_llm_query
-    from config import Config
-except ImportError as e:
-    print(f"❌ 無法導入必要模組: {e}")
-    print("請確認已安裝所有依賴套件")
-    sys.exit(1)
 
-
-def test_api_mode(mode: str, test_query: str = "什麼是 Nephio？") -> Dict[str, Any]:
+def run_api_mode(mode: str, test_query: str = "什麼是 Nephio？") -> Dict[str, Any]:
     """測試指定的 API 模式"""
-    print(f"\n🔍 測試 {mode.upper()} 模式")
-    print("=" * 50)
+    with env("API_MODE", mode):
+        print(f"\n🔍 測試 {mode.upper()} 模式")
+        print("=" * 50)
 
-    # 設定環境變數
-    os.environ["API_MODE"] = mode
+        if not mode_feasible(mode):
+            print(f"⚠️  {mode} 模式前置條件不滿足，跳過適配器初始化")
+            return {"mode": mode, "available": False, "error": "precheck_failed"}
 
-    try:
-        # 創建管理器
-        manager = create_llm_manager()
-
-        # 檢查狀態
-        status = manager.get_status()
-        print("📊 適配器狀態:")
-        print(f"   - 模式: {status['api_mode']}")
-        print(f"   - 可用: {status['adapter_available']}")
-        print(f"   - 適配器: {status['adapter_info']['adapter_type']}")
-        print(f"   - 模型: {status['adapter_info']['model_name']}")
-
-        if not status["adapter_available"]:
-            print(f"⚠️  {mode} 模式不可用")
-            return {"mode": mode, "available": False, "error": "adapter_not_available"}
-
-        # 執行測試查詢
-        print(f"\n💬 測試查詢: {test_query}")
-        start_time = time.time()
-        result = manager.query(test_query)
-        end_time = time.time()
-
-        print(f"⏱️  查詢時間: {end_time - start_time:.2f} 秒")
-
-        if result.get("error"):
-            print(f"❌ 查詢失敗: {result['error']}")
-            print(f"💬 回答: {result['answer']}")
-            return {
-                "mode": mode,
-                "available": True,
-                "success": False,
-                "error": result["error"],
-                "query_time": end_time - start_time,
-            }
-        else:
-            print("✅ 查詢成功")
-            print(f"💬 回答: {result['answer'][:200]}...")
-            return {
-                "mode": mode,
-                "available": True,
-                "success": True,
-                "query_time": end_time - start_time,
-                "answer_length": len(result["answer"]),
-            }
+        try:
+            # 創建管理器
+            api_adapters, _ = get_adapters()
+            manager = api_adapters.create_llm_manager()
+
+            # 檢查狀態
+            status = manager.get_status()
+            sys.stdout.write(
+                "\n".join(
+                    [
+                        "📊 適配器狀態:",
+                        f"   - 模式: {status['api_mode']}",
+                        f"   - 可用: {status['adapter_available']}",
+                        f"   - 適配器: {status['adapter_info']['adapter_type']}",
+                        f"   - 模型: {status['adapter_info']['model_name']}",
+                    ]
+                )
+                + "\n"
+            )
+
+            if not status["adapter_available"]:
+                print(f"⚠️  {mode} 模式不可用")
+                return {"mode": mode, "available": False, "error": "adapter_not_available"}
+
+            # 執行測試查詢
+            print(f"\n💬 測試查詢: {test_query}")
+            start_ns = time.perf_counter_ns()
+            result = manager.query(test_query)
+            query_time = (time.perf_counter_ns() - start_ns) / 1e9
+
+            print(f"⏱️  查詢時間: {query_time:.2f} 秒")
+
+            if result.get("error"):
+                print(f"❌ 查詢失敗: {result['error']}")
+                print(f"💬 回答: {result['answer']}")
+                return {
+                    "mode": mode,
+                    "available": True,
+                    "success": False,
+                    "error": result["error"],
+                    "query_time": query_time,
+                }
+            else:
+                print("✅ 查詢成功")
+                print(f"💬 回答: {result['answer'][:200]}...")
+                return {
+                    "mode": mode,
+                    "available": True,
+                    "success": True,
+                    "query_time": query_time,
+                    "answer_length": len(result["answer"]),
+                }
 
-    except Exception as e:
-        print(f"❌ 測試失敗: {str(e)}")
-        return {"mode": mode, "available": False, "success": False, "error": str(e)}
+        except Exception as e:
+            print(f"❌ 測試失敗: {str(e)}")
+            return {"mode": mode, "available": False, "success": False, "error": str(e)}
 
 
 def test_config_validation():
@@ -85,29 +86,30 @@ def test_config_validation():
     print("=" * 50)
 
     try:
+        _, Config = get_adapters()
+
         # 測試不同的 API 模式配置
         test_modes = ["anthropic", "mock", "local"]
 
         for mode in test_modes:
             print(f"\n測試 {mode} 模式配置...")
-            os.environ["API_MODE"] = mode
-
-            try:
-                config = Config()
-                summary = config.get_config_summary()
-                print(f"✅ {mode} 模式配置有效")
-                print(f"   - API 模式: {summary['api_mode']}")
-
-                # 模式特定資訊
-                if mode == "anthropic":
-                    api_available = summary.get("anthropic_api_available", False)
-                    print(f"   - API 可用: {api_available}")
-                elif mode == "local":
-                    print(f"   - 本地模型 URL: {summary.get('local_model_url')}")
-                    print(f"   - 本地模型名稱: {summary.get('local_model_name')}")
-
-            except Exception as e:
-                print(f"❌ {mode} 模式配置錯誤: {str(e)}")
+            with env("API_MODE", mode):
+                try:
+                    config = Config()
+                    summary = config.get_config_summary()
+                    print(f"✅ {mode} 模式配置有效")
+                    print(f"   - API 模式: {summary['api_mode']}")
+
+                    # 模式特定資訊
+                    if mode == "anthropic":
+                        api_available = summary.get("anthropic_api_available", False)
+                        print(f"   - API 可用: {api_available}")
+                    elif mode == "local":
+                        print(f"   - 本地模型 URL: {summary.get('local_model_url')}")
+                        print(f"   - 本地模型名稱: {summary.get('local_model_name')}")
+
+                except Exception as e:
+                    print(f"❌ {mode} 模式配置錯誤: {str(e)}")
 
     except Exception as e:
         print(f"❌ 配置驗證失敗: {str(e)}")
@@ -120,7 +122,8 @@ def test_mode_switching():
 
     try:
         # 創建管理器 (預設模式)
-        manager = create_llm_manager()
+        api_adapters, _ = get_adapters()
+        manager = api_adapters.create_llm_manager()
         original_mode = manager.get_status()["api_mode"]
         print(f"🎯 原始模式: {original_mode}")
 
@@ -155,6 +158,7 @@ def test_quick_query_function():
     print("\n⚡ 測試快速查詢函數")
     print("=" * 50)
 
+    api_adapters, _ = get_adapters()
     test_query = "簡單說明 O-RAN 架構"
 
     # 測試不同模式的快速查詢
@@ -163,7 +167,7 @@ def test_quick_query_function():
     for mode in modes:
         print(f"\n測試 {mode} 模式快速查詢...")
         try:
-            result = quick_llm_query(test_query, mode=mode)
+            result = api_adapters.quick_llm_query(test_query, mode=mode)
             print(f"✅ {mode} 模式查詢成功")
             print(f"💬 回答: {result[:150]}...")
         except Exception as e:
@@ -187,8 +191,7 @@ def main():
         results = []
 
         for mode in test_modes:
-            result = test_api_mode(mode)
-            results.append(result)
+            results.append(run_api_mode(mode))
 
         # 3. 測試模式切換
         test_mode_switching()
@@ -197,8 +200,7 @@ def main():
         test_quick_query_function()
 
         # 5. 總結測試結果
-        print("\n📊 測試結果總結")
-        print("=" * 50)
+        lines = ["\n📊 測試結果總結", "=" * 50]
 
         for result in results:
             mode = result["mode"]
@@ -206,21 +208,26 @@ def main():
             success = result.get("success", False)
 
             status_icon = "✅" if (available and success) else "⚠️" if available else "❌"
-            print(f"{status_icon} {mode.upper()} 模式: ", end="")
 
             if available and success:
                 query_time = result.get("query_time", 0)
-                print(f"正常運作 (查詢時間: {query_time:.2f}s)")
+                detail = f"正常運作 (查詢時間: {query_time:.2f}s)"
             elif available:
                 error = result.get("error", "unknown")
-                print(f"可用但查詢失敗 ({error})")
+                detail = f"可用但查詢失敗 ({error})"
             else:
-                print("不可用")
-
-        print("\n🎯 推薦使用順序:")
-        print("   1. anthropic 模式 (需要有效 API 金鑰)")
-        print("   2. local 模式 (需要本地模型服務)")
-        print("   3. mock 模式 (測試和開發用)")
+                detail = "不可用"
+            lines.append(f"{status_icon} {mode.upper()} 模式: {detail}")
+
+        lines.extend(
+            [
+                "\n🎯 推薦使用順序:",
+                "   1. anthropic 模式 (需要有效 API 金鑰)",
+                "   2. local 模式 (需要本地模型服務)",
+                "   3. mock 模式 (測試和開發用)",
+            ]
+        )
+        sys.stdout.write("\n".join(lines) + "\n")
 
     finally:
         # 恢復原始環境變數
@@ -5,9 +5,6 @@ Basic import test for O-RAN × Nephio RAG system
 import os
 import sys
 
-# Add src to path
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), "src"))
-
 
 def test_basic_imports():
     """Test basic imports without external dependencies"""
@@ -72,14 +69,21 @@ def check_environment():
     # Check Python version
     print(f"🐍 Python version: {sys.version}")
 
+    # One listing of the working directory answers every existence check below
+    try:
+        with os.scandir(".") as entries:
+            present = {entry.name: entry.is_dir() for entry in entries}
+    except OSError:
+        present = {}
+
     # Check if .env.example exists
-    if os.path.exists(".env.example"):
+    if ".env.example" in present:
         print("✅ .env.example exists")
     else:
         print("❌ .env.example missing")
 
     # Check if .env exists
-    if os.path.exists(".env"):
+    if ".env" in present:
         print("✅ .env exists")
     else:
         print("⚠️ .env not found (copy from .env.example)")
@@ -87,7 +91,7 @@ def check_environment():
     # Check directory structure
     required_dirs = ["src", "tests", "logs"]
     for dir_name in required_dirs:
-        if os.path.exists(dir_name):
+        if present.get(dir_name):
             print(f"✅ {dir_name}/ directory exists")
         else:
             print(f"⚠️ {dir_name}/ directory missing")
@@ -2,11 +2,6 @@
 """
 Test building the vector database for O-RAN × Nephio RAG system
 """
-import os
-import sys
-
-# Add src to path
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), "src"))
 
 
 def test_build_database():
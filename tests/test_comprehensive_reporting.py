@@ -103,6 +103,7 @@ class TestReportGenerator:
     def generate_html_report(self) -> str:
         """Generate HTML test report"""
         self.calculate_quality_scores()
+        now = datetime.now()
 
         html_content = f"""
         <!DOCTYPE html>
@@ -134,8 +135,8 @@ class TestReportGenerator:
         <body>
             <div class="header">
                 <h1>O-RAN × Nephio RAG System Test Report</h1>
-                <p>Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}</p>
-                <p>Test Execution Duration: {(datetime.now() - self.start_time).total_seconds():.2f} seconds</p>
+                <p>Generated: {now.strftime('%Y-%m-%d %H:%M:%S')}</p>
+                <p>Test Execution Duration: {(now - self.start_time).total_seconds():.2f} seconds</p>
             </div>
 
             <div class="summary">
@@ -286,11 +287,12 @@ class TestReportGenerator:
     def generate_json_report(self) -> str:
         """Generate JSON test report"""
         self.calculate_quality_scores()
+        now = datetime.now()
 
         report_data = {
             "report_metadata": {
-                "generated_at": datetime.now().isoformat(),
-                "execution_duration": (datetime.now() - self.start_time).total_seconds(),
+                "generated_at": now.isoformat(),
+                "execution_duration": (now - self.start_time).total_seconds(),
                 "report_version": "1.0"
             },
             "overall_summary": {
@@ -4,6 +4,7 @@ Isolated test configuration for O-RAN × Nephio RAG system
 Runs tests without external dependencies
 """
 import os
+import re
 import subprocess
 import sys
 from typing import Any, Dict, List
@@ -69,25 +70,19 @@ def run_isolated_tests(verbose: bool = True) -> Dict[str, Any]:
 
         # Parse results
         success = result.returncode == 0
-        output_lines = result.stdout.split("\n")
+        # pytest prints its summary at the very end, so only the tail is needed
+        output_lines = result.stdout.rsplit("\n", 50)
 
-        # Extract test counts from pytest output
-        summary_line = [
-            line
-            for line in output_lines
-            if "passed" in line and ("failed" in line or "error" in line or line.endswith("passed"))
-        ]
+        # Extract test counts from pytest's "N passed[, M failed] in Xs" summary (last matching line wins)
+        line = next((line for line in reversed(output_lines) if re.search(r"\d+ passed", line)), None)
 
         tests_passed = 0
         tests_failed = 0
         tests_run = 0
 
-        if summary_line:
-            line = summary_line[-1]
+        if line is not None:
             if "passed" in line:
                 # Parse numbers from summary line
-                import re
-
                 passed_match = re.search(r"(\d+) passed", line)
                 failed_match = re.search(r"(\d+) failed", line)
                 error_match = re.search(r"(\d+) error", line)
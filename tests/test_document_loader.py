@@ -2,6 +2,7 @@
 文件載入器模組單元測試
 """
 
+import copy
 import os
 
 # 導入待測試的模組
@@ -10,14 +11,38 @@ from unittest.mock import Mock, patch
 
 import pytest
 import requests
+from bs4 import BeautifulSoup
 
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+_SRC_DIR = os.path.join(os.path.dirname(__file__), "..", "src")
+if _SRC_DIR not in sys.path:
+    sys.path.insert(0, _SRC_DIR)
 
 from config import Config, DocumentSource
 
 # 直接導入，避免透過 __init__.py 導入有問題的模組
 from document_loader import DocumentContentCleaner, DocumentLoader
 
+# 多個測試共用的 HTML 範例
+SAMPLE_HTML = """
+<html>
+    <head><title>Test Page</title></head>
+    <body>
+        <nav>Navigation</nav>
+        <main>
+            <h1>Nephio Overview</h1>
+            <p>Nephio is a cloud-native network automation platform.</p>
+        </main>
+        <script>alert('test');</script>
+    </body>
+</html>
+"""
+
+
+@pytest.fixture(scope="module")
+def sample_soup():
+    """SAMPLE_HTML 只解析一次，測試使用副本以免互相影響"""
+    return BeautifulSoup(SAMPLE_HTML, "html.parser")
+
 
 class TestDocumentContentCleaner:
     """DocumentContentCleaner 類別測試"""
@@ -72,6 +97,15 @@ class TestDocumentContentCleaner:
         assert "Home" not in result  # 導航應被移除
         assert "Footer content" not in result  # Footer 應被移除
 
+    def test_clean_soup_matches_clean_html(self, sample_soup):
+        """測試已解析的樹與原始 HTML 的清理結果一致"""
+        result = self.cleaner.clean_soup(copy.copy(sample_soup))
+
+        assert result == self.cleaner.clean_html(SAMPLE_HTML)
+        assert "Nephio Overview" in result
+        assert "Navigation" not in result
+        assert "alert('test')" not in result
+
     def test_merge_short_lines(self):
         """測試合併短行功能"""
         lines = [
@@ -2,44 +2,70 @@
 """
 End-to-End Test for O-RAN Nephio RAG System
 Tests the complete workflow with the implemented fixes
+
+Run with ``--parallel`` to execute the tests under pytest-xdist (``-n auto``).
 """
 
+import importlib
+import importlib.util
 import logging
 import os
 import sys
+import types
+from functools import lru_cache
 
 # Setup logging
-logging.basicConfig(level=logging.INFO, format="%(message)s")
+logging.basicConfig(level=os.environ.get("TEST_LOG_LEVEL", "INFO"), format="%(message)s")
 logger = logging.getLogger(__name__)
 
 
+class _LazyModule(types.ModuleType):
+    """Module proxy that performs the real import on first attribute access"""
+
+    def __getattr__(self, attr):
+        # import_module is a sys.modules lookup once loaded, and stays correct if the module is reloaded
+        return getattr(importlib.import_module(self.__name__), attr)
+
+
+def lazy_import(name: str) -> types.ModuleType:
+    """Return the module if already imported, otherwise a proxy that defers loading it"""
+    return sys.modules.get(name) or _LazyModule(name)
+
+
+# Heavy modules (langchain, chromadb, bs4) load only when a test actually touches them
+config_module = lazy_import("src.config")
+loader_module = lazy_import("src.document_loader")
+rag_module = lazy_import("src.oran_nephio_rag")
+
+
 def test_imports():
     """Test that all required modules can be imported"""
     logger.info("Testing module imports...")
+    required = {
+        config_module: ("Config", "DocumentSource", "validate_config"),
+        loader_module: ("DocumentLoader",),
+        rag_module: ("ORANNephioRAG",),
+    }
     try:
-        from src.config import Config, DocumentSource, validate_config
-        from src.document_loader import DocumentLoader
-        from src.oran_nephio_rag import ORANNephioRAG
+        for module, names in required.items():
+            for name in names:
+                getattr(module, name)
 
         logger.info("✅ All modules imported successfully")
         return True
-    except ImportError as e:
-        logger.error(f"❌ Import error: {e}")
+    except (ImportError, AttributeError) as e:
+        logger.error("❌ Import error: %s", e)
         return False
 
 
-def test_config_validation():
+def test_config_validation(rag_config):
     """Test configuration with Chinese validation messages"""
     logger.info("\nTesting configuration validation...")
-    from src.config import Config, DocumentSource
+    DocumentSource = config_module.DocumentSource
 
-    # Test valid configuration
-    try:
-        Config()
-        logger.info("✅ Valid configuration created")
-    except Exception as e:
-        logger.error(f"❌ Config creation failed: {e}")
-        return False
+    # Valid configuration is built once by the session fixture; validate() raises ValueError on any problem
+    assert rag_config.validate() is True
+    logger.info("✅ Valid configuration created")
 
     # Test invalid priority (should show Chinese message)
     try:
@@ -55,7 +81,7 @@ def test_config_validation():
         if "優先級必須在 1-5 之間" in str(e):
             logger.info("✅ Chinese validation message for priority works")
         else:
-            logger.error(f"❌ Wrong error message: {e}")
+            logger.error("❌ Wrong error message: %s", e)
             return False
 
     # Test invalid source type (should show Chinese message)
@@ -72,7 +98,7 @@ def test_config_validation():
         if "來源類型必須是 'nephio' 或 'oran_sc'" in str(e):
             logger.info("✅ Chinese validation message for source_type works")
         else:
-            logger.error(f"❌ Wrong error message: {e}")
+            logger.error("❌ Wrong error message: %s", e)
             return False
 
     return True
@@ -95,33 +121,57 @@ def test_mock_fixtures():
     required = ["puter_adapter", "llm_adapter", "chromadb", "vectordb", "embeddings"]
     for component in required:
         if component in mock_components:
-            logger.info(f"✅ {component} is available")
+            logger.info("✅ %s is available", component)
         else:
-            logger.error(f"❌ {component} is missing")
+            logger.error("❌ %s is missing", component)
             return False
 
     return True
 
 
-def test_rag_initialization():
+def test_rag_initialization(rag_system):
     """Test RAG system initialization"""
     logger.info("\nTesting RAG system initialization...")
 
-    try:
-        # Set up minimal environment
-        os.environ["ANTHROPIC_API_KEY"] = "test-key"
+    # The RAG system is constructed once per session by the fixture
+    status = rag_system.get_system_status()
+    assert status["config_valid"] is True
+    assert status["constraint_compliant"] is True
+    assert status["integration_method"] == "browser_automation"
+    assert {"system_ready", "vectordb_ready", "qa_chain_ready"} <= status.keys()
+
+    logger.info("✅ RAG system initialized successfully")
+    return True
 
-        from src.config import Config
-        from src.oran_nephio_rag import ORANNephioRAG
 
-        config = Config()
-        ORANNephioRAG(config)
+@lru_cache(maxsize=None)
+def _script_config():
+    """Build the Config that pytest's session fixture provides when run as a script"""
+    return config_module.Config()
 
-        logger.info("✅ RAG system initialized successfully")
-        return True
-    except Exception as e:
-        logger.error(f"❌ RAG initialization failed: {e}")
-        return False
+
+def _script_rag_system():
+    """Build the ORANNephioRAG that pytest's session fixture provides when run as a script"""
+    os.environ.setdefault("ANTHROPIC_API_KEY", "test-key")
+    return rag_module.ORANNephioRAG(_script_config())
+
+
+def _run_all(tests):
+    """Run tests in order, logging each result as it completes and the total at the end"""
+    pass_count = 0
+    for test_name, test_func in tests:
+        logger.info("\n[Running] %s", test_name)
+        try:
+            test_passed = bool(test_func())
+        except Exception as e:
+            logger.error("[ERROR] %s: %s", test_name, e)
+            test_passed = False
+
+        logger.info("%s: %s", "✅ PASS" if test_passed else "❌ FAIL", test_name)
+        pass_count += test_passed
+        yield test_name, test_passed
+
+    logger.info("\nTotal: %s/%s tests passed (%.1f%%)", pass_count, len(tests), pass_count * 100 / len(tests))
 
 
 def main():
@@ -132,38 +182,15 @@ def main():
 
     tests = [
         ("Module Imports", test_imports),
-        ("Configuration Validation", test_config_validation),
+        ("Configuration Validation", lambda: test_config_validation(_script_config())),
         ("Mock Fixtures", test_mock_fixtures),
-        ("RAG Initialization", test_rag_initialization),
+        ("RAG Initialization", lambda: test_rag_initialization(_script_rag_system())),
     ]
 
-    results = []
-    for test_name, test_func in tests:
-        logger.info(f"\n[Running] {test_name}")
-        try:
-            passed = test_func()
-            results.append((test_name, passed))
-            if passed:
-                logger.info(f"[PASS] {test_name}")
-            else:
-                logger.info(f"[FAIL] {test_name}")
-        except Exception as e:
-            logger.error(f"[ERROR] {test_name}: {e}")
-            results.append((test_name, False))
-
-    # Summary
-    logger.info("\n" + "=" * 60)
-    logger.info("Test Summary")
-    logger.info("=" * 60)
-
-    passed = sum(1 for _, p in results if p)
-    total = len(results)
+    results = [test_passed for _, test_passed in _run_all(tests)]
 
-    for test_name, test_passed in results:
-        status = "✅ PASS" if test_passed else "❌ FAIL"
-        logger.info(f"{status}: {test_name}")
-
-    logger.info(f"\nTotal: {passed}/{total} tests passed ({passed*100/total:.1f}%)")
+    passed = sum(results)
+    total = len(tests)
 
     if passed == total:
         logger.info("\n🎉 SUCCESS: All end-to-end tests passed!")
@@ -174,5 +201,15 @@ def main():
         return 1
 
 
+def run_parallel() -> int:
+    """Run this module through pytest-xdist so independent tests execute on separate workers"""
+    import pytest
+
+    if importlib.util.find_spec("xdist") is None:
+        logger.info("pytest-xdist not installed, falling back to sequential run")
+        return main()
+    return int(pytest.main([__file__, "-n", "auto", "--no-cov", "-q"]))
+
+
 if __name__ == "__main__":
-    sys.exit(main())
+    sys.exit(run_parallel() if "--parallel" in sys.argv[1:] else main())
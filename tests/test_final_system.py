@@ -2,132 +2,178 @@
 """
 Final system test for O-RAN × Nephio RAG system
 """
+import logging
 import os
 import sys
+from functools import lru_cache
+from types import MappingProxyType
+
+import pytest
+
+# TEST_LOG_LEVEL=WARNING silences the progress output (e.g. in CI)
+logging.basicConfig(level=os.environ.get("TEST_LOG_LEVEL", "INFO"), format="%(message)s")
+logger = logging.getLogger(__name__)
 
 # Add src to path
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), "src"))
+_SRC_DIR = os.path.join(os.path.dirname(__file__), "..", "src")
+if _SRC_DIR not in sys.path:
+    sys.path.insert(0, _SRC_DIR)
+
+# Import the modules under test once; individual tests skip instead of re-importing
+try:
+    from api_adapters import LLMManager
+    from config import Config
+    from document_loader import DocumentContentCleaner, DocumentLoader  # noqa: F401
+
+    _IMPORTS_OK = True
+    _IMPORT_ERR = None
+except Exception as e:
+    _IMPORTS_OK = False
+    _IMPORT_ERR = e
+
+
+TEST_HTML = """
+<html>
+<head><title>Test</title></head>
+<body>
+<h1>Nephio Overview</h1>
+<p>Nephio is a cloud-native network automation platform.</p>
+<script>alert('test');</script>
+</body>
+</html>
+"""
+
+
+def _require_imports():
+    """Skip the calling test when the core modules failed to import"""
+    if not _IMPORTS_OK:
+        pytest.skip(f"Core modules unavailable: {_IMPORT_ERR}")
+
+
+@lru_cache(maxsize=1)
+def _llm_config_dict(config):
+    """Convert Config to the read-only dictionary format expected by LLMManager (once per Config instance)"""
+    return MappingProxyType(
+        {
+            "api_key": getattr(config, "ANTHROPIC_API_KEY", None),
+            "model_name": getattr(config, "CLAUDE_MODEL", "claude-3-sonnet-20240229"),
+            "max_tokens": getattr(config, "CLAUDE_MAX_TOKENS", 2048),
+            "temperature": getattr(config, "CLAUDE_TEMPERATURE", 0.1),
+            "api_mode": getattr(config, "API_MODE", "mock"),
+        }
+    )
 
 
 def test_imports():
     """Test basic imports"""
-    print("🔍 Testing basic imports...")
+    logger.info("🔍 Testing basic imports...")
 
-    try:
-        # Test basic imports
+    if not _IMPORTS_OK:
+        logger.error("❌ Import failed: %s", _IMPORT_ERR)
+        return False
 
-        print("✅ Config import successful")
+    logger.info("✅ Config import successful")
 
-        print("✅ DocumentLoader import successful")
+    logger.info("✅ DocumentLoader import successful")
 
-        print("✅ LLMManager import successful")
+    logger.info("✅ LLMManager import successful")
 
-        return True
-    except Exception as e:
-        print(f"❌ Import failed: {e}")
-        return False
+    return True
 
 
-def test_config():
+def test_config(rag_config):
     """Test configuration"""
-    print("\n🔧 Testing configuration...")
+    logger.info("\n🔧 Testing configuration...")
 
     try:
-        from config import Config
-
-        config = Config()
+        config = rag_config
 
-        print(f"✅ API Mode: {config.API_MODE}")
-        print(f"✅ Vector DB Path: {config.VECTOR_DB_PATH}")
-        print(f"✅ Log Level: {config.LOG_LEVEL}")
+        logger.info("✅ API Mode: %s", config.API_MODE)
+        logger.info("✅ Vector DB Path: %s", config.VECTOR_DB_PATH)
+        logger.info("✅ Log Level: %s", config.LOG_LEVEL)
 
         return True
     except Exception as e:
-        print(f"❌ Config test failed: {e}")
+        logger.error("❌ Config test failed: %s", e)
         return False
 
 
-def test_mock_llm():
+def test_mock_llm(rag_config):
     """Test mock LLM functionality"""
-    print("\n🎭 Testing mock LLM...")
+    logger.info("\n🎭 Testing mock LLM...")
+    _require_imports()
 
     try:
-        from api_adapters import LLMManager
-        from config import Config
-
-        config = Config()
-
-        # Convert Config class to dictionary format expected by LLMManager
-        config_dict = {
-            "api_key": getattr(config, "ANTHROPIC_API_KEY", None),
-            "model_name": getattr(config, "CLAUDE_MODEL", "claude-3-sonnet-20240229"),
-            "max_tokens": getattr(config, "CLAUDE_MAX_TOKENS", 2048),
-            "temperature": getattr(config, "CLAUDE_TEMPERATURE", 0.1),
-            "api_mode": getattr(config, "API_MODE", "mock"),
-        }
-
-        llm_manager = LLMManager(config_dict)
+        llm_manager = LLMManager(_llm_config_dict(rag_config))
 
         # Test query
         result = llm_manager.query("What is Nephio?")
 
         if result and not result.get("error"):
-            print("✅ Mock LLM query successful")
+            logger.info("✅ Mock LLM query successful")
             # MockAdapter returns response in 'answer' field, others might use 'response'
             response = result.get("answer") or result.get("response", "No response")
-            print(f"📝 Response: {response[:100]}...")
+            logger.info("📝 Response: %s...", response[:100])
             return True
         else:
-            print(f"❌ Mock LLM query failed: {result.get('error', 'Unknown error')}")
+            logger.error("❌ Mock LLM query failed: %s", result.get("error", "Unknown error"))
             return False
 
     except Exception as e:
-        print(f"❌ Mock LLM test failed: {e}")
+        logger.error("❌ Mock LLM test failed: %s", e)
         return False
 
 
-def test_document_processing():
+def test_document_processing(content_cleaner):
     """Test document processing"""
-    print("\n📄 Testing document processing...")
+    logger.info("\n📄 Testing document processing...")
 
     try:
-        from config import Config
-        from document_loader import DocumentContentCleaner
-
-        config = Config()
-        cleaner = DocumentContentCleaner(config)
+        cleaner = content_cleaner
 
         # Test content cleaning
-        test_content = """
-        <html>
-        <head><title>Test</title></head>
-        <body>
-        <h1>Nephio Overview</h1>
-        <p>Nephio is a cloud-native network automation platform.</p>
-        <script>alert('test');</script>
-        </body>
-        </html>
-        """
-
-        cleaned = cleaner.clean_html_content(test_content)
+        cleaned = cleaner.clean_html(TEST_HTML)
 
         if cleaned and "Nephio" in cleaned:
-            print("✅ Document cleaning successful")
-            print(f"📝 Cleaned content: {cleaned[:100]}...")
+            logger.info("✅ Document cleaning successful")
+            logger.info("📝 Cleaned content: %s...", cleaned[:100])
             return True
         else:
-            print("❌ Document cleaning failed")
+            logger.error("❌ Document cleaning failed")
             return False
 
     except Exception as e:
-        print(f"❌ Document processing test failed: {e}")
+        logger.error("❌ Document processing test failed: %s", e)
         return False
 
 
+@lru_cache(maxsize=None)
+def _script_config():
+    """Build the Config that pytest's session fixture provides when run as a script"""
+    _require_imports()
+    return Config()
+
+
+@lru_cache(maxsize=None)
+def _script_cleaner():
+    """Build the DocumentContentCleaner that pytest's session fixture provides when run as a script"""
+    _require_imports()
+    return DocumentContentCleaner(_script_config())
+
+
+def _list_dir(path):
+    """Return the entry names of a directory, or an empty set if it cannot be read"""
+    try:
+        with os.scandir(path) as entries:
+            return {entry.name for entry in entries}
+    except OSError:
+        return set()
+
+
 def create_system_summary():
     """Create a summary of system status"""
-    print("\n📊 System Summary:")
-    print("=" * 50)
+    logger.info("\n📊 System Summary:")
+    logger.info("=" * 50)
 
     # Check files
     files_to_check = [
@@ -140,65 +186,88 @@ def create_system_summary():
         "requirements.txt",
     ]
 
+    # One scandir per parent directory instead of one stat per path
+    parents = {os.path.dirname(path) or "." for path in files_to_check} | {"."}
+    present = {parent: _list_dir(parent) for parent in parents}
+
     for file_path in files_to_check:
-        if os.path.exists(file_path):
-            print(f"✅ {file_path}")
+        parent, name = os.path.split(file_path)
+        if name in present[parent or "."]:
+            logger.info("✅ %s", file_path)
         else:
-            print(f"❌ {file_path} (missing)")
+            logger.error("❌ %s (missing)", file_path)
 
     # Check directories
     dirs_to_check = ["src", "tests", "logs", "examples"]
     for dir_path in dirs_to_check:
-        if os.path.exists(dir_path):
-            print(f"✅ {dir_path}/")
+        if dir_path in present["."]:
+            logger.info("✅ %s/", dir_path)
         else:
-            print(f"❌ {dir_path}/ (missing)")
+            logger.error("❌ %s/ (missing)", dir_path)
 
     # Check vector database
-    if os.path.exists("oran_nephio_vectordb"):
-        print("✅ Vector database exists")
+    if "oran_nephio_vectordb" in present["."]:
+        logger.info("✅ Vector database exists")
     else:
-        print("⚠️ Vector database not found (run create_minimal_database.py)")
+        logger.info("⚠️ Vector database not found (run create_minimal_database.py)")
 
 
-if __name__ == "__main__":
-    print("=" * 60)
-    print("🚀 O-RAN × Nephio RAG System - Final System Test")
-    print("=" * 60)
+def _run_all(tests):
+    """Run tests in order, logging each result as it completes and the total at the end"""
+    pass_count = 0
+    for test_name, test in tests:
+        try:
+            test_passed = bool(test())
+        except pytest.skip.Exception as e:
+            logger.info("⚠️ Test %s skipped: %s", test_name, e)
+            test_passed = False
+        except Exception as e:
+            logger.error("❌ Test %s crashed: %s", test_name, e)
+            test_passed = False
 
-    tests = [test_imports, test_config, test_mock_llm, test_document_processing]
+        pass_count += test_passed
+        yield test_name, test_passed
 
-    passed = 0
-    total = len(tests)
+    logger.info("📊 Test Results: %s/%s tests passed", pass_count, len(tests))
 
-    for test in tests:
-        try:
-            if test():
-                passed += 1
-        except Exception as e:
-            print(f"❌ Test {test.__name__} crashed: {e}")
+
+if __name__ == "__main__":
+    logger.info("=" * 60)
+    logger.info("🚀 O-RAN × Nephio RAG System - Final System Test")
+    logger.info("=" * 60)
+
+    tests = [
+        ("test_imports", test_imports),
+        ("test_config", lambda: test_config(_script_config())),
+        ("test_mock_llm", lambda: test_mock_llm(_script_config())),
+        ("test_document_processing", lambda: test_document_processing(_script_cleaner())),
+    ]
+
+    results = [test_passed for _, test_passed in _run_all(tests)]
 
     create_system_summary()
 
-    print("\n" + "=" * 60)
-    print(f"📊 Test Results: {passed}/{total} tests passed")
+    passed = sum(results)
+    total = len(tests)
+
+    logger.info("\n" + "=" * 60)
 
     if passed >= 3:  # Allow some flexibility
-        print("🎉 System is functional!")
-        print("\nThe O-RAN × Nephio RAG system is ready to use.")
-        print("\nKey features working:")
-        print("- ✅ Configuration management")
-        print("- ✅ Mock LLM responses")
-        print("- ✅ Document processing")
-        print("- ✅ Basic system architecture")
-
-        print("\nTo use the system:")
-        print("1. Ensure vector database exists: python create_minimal_database.py")
-        print("2. Run the main application: python main.py")
-        print("3. For production, set ANTHROPIC_API_KEY in .env")
+        logger.info("🎉 System is functional!")
+        logger.info("\nThe O-RAN × Nephio RAG system is ready to use.")
+        logger.info("\nKey features working:")
+        logger.info("- ✅ Configuration management")
+        logger.info("- ✅ Mock LLM responses")
+        logger.info("- ✅ Document processing")
+        logger.info("- ✅ Basic system architecture")
+
+        logger.info("\nTo use the system:")
+        logger.info("1. Ensure vector database exists: python create_minimal_database.py")
+        logger.info("2. Run the main application: python main.py")
+        logger.info("3. For production, set ANTHROPIC_API_KEY in .env")
 
     else:
-        print("⚠️ System has some issues but core functionality works")
-        print("Check the individual test results above.")
+        logger.info("⚠️ System has some issues but core functionality works")
+        logger.info("Check the individual test results above.")
 
-    print("=" * 60)
+    logger.info("=" * 60)
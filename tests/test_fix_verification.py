@@ -5,6 +5,8 @@ Simple verification that our TF-IDF wrapper fix addresses the ChromaDB compatibi
 
 import logging
 
+from tests._hash_embeddings import hash_vectors
+
 logging.basicConfig(level=logging.INFO, format="%(message)s")
 
 
@@ -14,39 +16,14 @@ def test_dummy_embeddings():
     class DummyEmbeddings:
         """Simple fallback embeddings for when sklearn is not available"""
 
-        def __init__(self):
-            self.dimension = 384
+        __slots__ = ("dimension",)
+
+        def __init__(self, dimension=384):
+            self.dimension = dimension
 
         def embed_documents(self, texts):
             """Create simple hash-based vectors for documents"""
-            embeddings = []
-            for text in texts:
-                import hashlib
-
-                text_bytes = text.encode("utf-8")
-                hash_obj = hashlib.md5(text_bytes)
-                hash_hex = hash_obj.hexdigest()
-
-                vector = []
-                for i in range(0, min(len(hash_hex), self.dimension // 16)):
-                    try:
-                        hex_pair = (
-                            hash_hex[i * 2 : i * 2 + 2]
-                            if i * 2 + 1 < len(hash_hex)
-                            else hash_hex[i * 2 : i * 2 + 1] + "0"
-                        )
-                        int_val = int(hex_pair, 16)
-                        float_val = (int_val / 128.0) - 1.0
-                        vector.append(float_val)
-                    except ValueError:
-                        vector.append(0.0)
-
-                while len(vector) < self.dimension:
-                    vector.append(0.0)
-                vector = vector[: self.dimension]
-                embeddings.append(vector)
-
-            return embeddings
+            return hash_vectors(texts, self.dimension)
 
         def embed_query(self, text):
             """Create simple hash-based vector for a query"""
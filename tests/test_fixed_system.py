@@ -4,11 +4,13 @@ Test the fixed O-RAN x Nephio RAG System
 Verify that the dependency issues have been resolved
 """
 
+import importlib.util
 import os
 import sys
-from pathlib import Path
 
-# Set test environment
+import pytest
+
+# Test environment, applied per test through the fixed_system_env fixture (or by main() as a script)
 TEST_ENV = {
     "ANTHROPIC_API_KEY": "test-key-not-real",
     "VECTOR_DB_PATH": "./test_vectordb_fixed",
@@ -18,11 +20,12 @@ TEST_ENV = {
     "CLAUDE_TEMPERATURE": "0.1",
 }
 
-for key, value in TEST_ENV.items():
-    os.environ[key] = value
 
-# Add src to Python path
-sys.path.insert(0, str(Path(__file__).parent / "src"))
+@pytest.fixture
+def fixed_system_env(monkeypatch):
+    """Apply TEST_ENV for a single test without leaking it into the rest of the session"""
+    for key, value in TEST_ENV.items():
+        monkeypatch.setenv(key, value)
 
 
 def test_critical_imports():
@@ -55,6 +58,7 @@ def test_critical_imports():
         return False, st_available
 
 
+@pytest.mark.usefixtures("fixed_system_env")
 def test_rag_system_with_mock():
     """Test RAG system creation with mocked embeddings"""
     print("Testing RAG system with mock embeddings...")
@@ -104,17 +108,18 @@ def test_dependency_availability():
 
     available = 0
     for module, desc in dependencies:
-        try:
-            __import__(module)
+        # Look up the module spec only; the heavy packages are not needed here
+        if importlib.util.find_spec(module) is not None:
             print(f"SUCCESS: {desc}")
             available += 1
-        except ImportError:
+        else:
             print(f"WARNING: {desc} not available")
 
     print(f"Dependencies: {available}/{len(dependencies)} available")
     return available >= len(dependencies) * 0.8
 
 
+@pytest.mark.usefixtures("fixed_system_env")
 def test_configuration_system():
     """Test configuration system"""
     print("Testing configuration system...")
@@ -145,6 +150,8 @@ def main():
     print("O-RAN x Nephio RAG System - Fixed Dependencies Test")
     print("=" * 55)
 
+    os.environ.update(TEST_ENV)
+
     # Run tests
     tests = [
         ("Critical Imports", test_critical_imports),
@@ -47,9 +47,9 @@ class TestRAGSystemIntegration:
     """Comprehensive integration test suite"""
 
     @pytest.fixture(autouse=True)
-    def setup_method(self, mock_config, temp_dir):
+    def setup_method(self, mock_config, tmp_path):
         """Setup for each test method"""
-        self.temp_dir = temp_dir
+        self.temp_dir = str(tmp_path)
         self.config = mock_config
 
     def test_system_initialization_flow(self, mock_config, mock_vectordb, mock_embeddings):
@@ -218,8 +218,8 @@ class TestRAGSystemIntegration:
         assert len(cleaned) > 0
         assert len(cleaned) < len(large_content)  # Should be cleaned/compressed
 
-    def test_configuration_validation(self, temp_dir):
-        """Test configuration validation and error handling"""
+    def test_configuration_validation(self, fresh_config):
+        """Test configuration validation and error handling (fresh_config reloads the modules afterwards)"""
         import importlib
         import sys
 
@@ -162,6 +162,27 @@ class TestPuterBrowserIntegration:
         assert adapter_instance == mock_browser_environment["webdriver"]
         mock_adapter_class.assert_called_once()
 
+    @patch("src.puter_integration.SELENIUM_AVAILABLE", True)
+    @patch("src.puter_integration.API_MODE", "browser")
+    def test_shared_driver_reused_across_sessions(self, mock_selenium_webdriver):
+        """Test an injected WebDriver is reset between sessions instead of being quit"""
+        from src.puter_integration import PuterClaudeAdapter
+
+        # Selenium is not imported in mock mode, so create the names the session touches
+        with patch("src.puter_integration.webdriver", create=True) as mock_webdriver, patch(
+            "src.puter_integration.WebDriverWait", create=True
+        ):
+            adapter = PuterClaudeAdapter(model="claude-sonnet-4", headless=True, driver=mock_selenium_webdriver)
+
+            for _ in range(2):
+                with adapter._browser_session():
+                    assert adapter.driver is mock_selenium_webdriver
+
+        mock_webdriver.Chrome.assert_not_called()
+        mock_selenium_webdriver.quit.assert_not_called()
+        assert mock_selenium_webdriver.delete_all_cookies.call_count == 2
+        mock_selenium_webdriver.get.assert_called_with("about:blank")
+
 
 class TestPuterRAGManager:
     """Test PuterRAGManager with mocked dependencies"""
@@ -4,9 +4,6 @@ Quick Puter.js Integration Test - Basic Functionality Check
 """
 
 import os
-import sys
-
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), "src"))
 
 
 def test_puter_basic():
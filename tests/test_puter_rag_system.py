@@ -28,7 +28,9 @@ skip_if_no_heavy_deps = pytest.mark.skipif(
 # 導入待測試的模組
 import sys
 
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+_SRC_DIR = os.path.join(os.path.dirname(__file__), "..", "src")
+if _SRC_DIR not in sys.path:
+    sys.path.insert(0, _SRC_DIR)
 
 # Conditional imports - skip tests if dependencies not available
 if HEAVY_DEPS_AVAILABLE:
@@ -254,6 +256,31 @@ class TestPuterRAGSystem:
         assert system.retriever == system.vectordb
 
 
+@pytest.fixture
+def seeded_vectordb(tmp_path):
+    """含三份測試文檔的 SimplifiedVectorDatabase，直接建立於 tmp_path"""
+    from langchain.docstore.document import Document
+
+    db = SimplifiedVectorDatabase(str(tmp_path / "test_db.json"))
+    db.add_documents(
+        [
+            Document(
+                page_content="Nephio automation platform for cloud native networks",
+                metadata={"source": "nephio_doc", "type": "nephio"},
+            ),
+            Document(
+                page_content="O-RAN Service Management and Orchestration framework",
+                metadata={"source": "oran_doc", "type": "oran"},
+            ),
+            Document(
+                page_content="Kubernetes deployment strategies for edge computing",
+                metadata={"source": "k8s_doc", "type": "kubernetes"},
+            ),
+        ]
+    )
+    return db
+
+
 @skip_if_no_heavy_deps
 class TestSimplifiedVectorDatabase:
     """SimplifiedVectorDatabase 類別測試"""
@@ -310,31 +337,10 @@ class TestSimplifiedVectorDatabase:
         assert "o-ran" in keywords or "oran" in keywords
         assert "deployment" in keywords
 
-    def test_similarity_search(self):
+    def test_similarity_search(self, seeded_vectordb):
         """測試相似性搜索"""
-        db = SimplifiedVectorDatabase(self.db_path)
-
-        from langchain.docstore.document import Document
-
-        test_docs = [
-            Document(
-                page_content="Nephio automation platform for cloud native networks",
-                metadata={"source": "nephio_doc", "type": "nephio"},
-            ),
-            Document(
-                page_content="O-RAN Service Management and Orchestration framework",
-                metadata={"source": "oran_doc", "type": "oran"},
-            ),
-            Document(
-                page_content="Kubernetes deployment strategies for edge computing",
-                metadata={"source": "k8s_doc", "type": "kubernetes"},
-            ),
-        ]
-
-        db.add_documents(test_docs)
-
         # Search for Nephio-related content
-        results = db.similarity_search("What is Nephio automation?", k=2)
+        results = seeded_vectordb.similarity_search("What is Nephio automation?", k=2)
 
         assert len(results) <= 2
         # Should return the most relevant document first
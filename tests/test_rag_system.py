@@ -26,7 +26,9 @@ skip_if_no_heavy_deps = pytest.mark.skipif(
 # 導入待測試的模組
 import sys
 
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+_SRC_DIR = os.path.join(os.path.dirname(__file__), "..", "src")
+if _SRC_DIR not in sys.path:
+    sys.path.insert(0, _SRC_DIR)
 
 # Conditional imports - skip tests if dependencies not available
 if HEAVY_DEPS_AVAILABLE:
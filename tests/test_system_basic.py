@@ -5,148 +5,115 @@ Tests core functionality without requiring API keys
 """
 import os
 import sys
+from pathlib import Path
+
+import pytest
+
+# Repository root, so the checks below do not depend on the working directory
+_REPO_ROOT = Path(__file__).resolve().parents[1]
 
 # Add src to path
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), "src"))
+_SRC_DIR = os.path.join(os.path.dirname(__file__), "..", "src")
+if _SRC_DIR not in sys.path:
+    sys.path.insert(0, _SRC_DIR)
 
 
-def test_config_loading():
+def test_config_loading(rag_config):
     """Test configuration loading"""
     print("🔧 Testing configuration loading...")
 
-    try:
-        from config import Config
+    config = rag_config
+    assert config.API_MODE in ("browser", "mock")
+    assert config.VECTOR_DB_PATH
+    assert config.LOG_LEVEL
 
-        config = Config()
-        print("✅ Config loaded successfully")
-        print(f"   - API Mode: {config.API_MODE}")
-        print(f"   - Vector DB Path: {config.VECTOR_DB_PATH}")
-        print(f"   - Log Level: {config.LOG_LEVEL}")
-        return True
-    except Exception as e:
-        print(f"❌ Config loading failed: {e}")
-        return False
+    print("✅ Config loaded successfully")
+    print(f"   - API Mode: {config.API_MODE}")
+    print(f"   - Vector DB Path: {config.VECTOR_DB_PATH}")
+    print(f"   - Log Level: {config.LOG_LEVEL}")
 
 
-def test_document_loader():
+def test_document_loader(document_loader, content_cleaner):
     """Test document loader initialization"""
     print("\n📄 Testing document loader...")
 
-    try:
-        from config import Config
-        from document_loader import DocumentContentCleaner, DocumentLoader
-
-        config = Config()
-        DocumentLoader(config)
-        DocumentContentCleaner(config)
+    assert document_loader is not None
+    assert content_cleaner is not None
 
-        print("✅ DocumentLoader initialized successfully")
-        print("✅ DocumentContentCleaner initialized successfully")
-        return True
-    except Exception as e:
-        print(f"❌ Document loader test failed: {e}")
-        return False
+    print("✅ DocumentLoader initialized successfully")
+    print("✅ DocumentContentCleaner initialized successfully")
 
 
-def test_mock_mode():
+def test_mock_mode(monkeypatch):
     """Test if we can run in mock mode"""
     print("\n🎭 Testing mock mode...")
 
-    try:
-        # Set mock mode
-        os.environ["API_MODE"] = "mock"
+    # Set mock mode for this test only, leaving the shared config fixture untouched
+    monkeypatch.setenv("API_MODE", "mock")
 
-        from config import Config
+    from config import Config
 
-        config = Config()
+    config = Config()
 
-        if config.API_MODE == "mock":
-            print("✅ Mock mode configured successfully")
-            return True
-        else:
-            print(f"❌ Mock mode not set correctly: {config.API_MODE}")
-            return False
-    except Exception as e:
-        print(f"❌ Mock mode test failed: {e}")
-        return False
+    assert config.API_MODE == "mock", f"Mock mode not set correctly: {config.API_MODE}"
+    print("✅ Mock mode configured successfully")
 
 
+@pytest.mark.integration
 def test_directory_structure():
     """Test required directories exist"""
     print("\n📁 Testing directory structure...")
 
-    required_dirs = ["src", "tests", "logs", "examples", "monitoring"]
+    # logs/ is created at runtime and is not part of the checkout
+    required_dirs = ["src", "tests", "examples", "monitoring"]
+
+    # One directory listing instead of a stat per required directory
+    try:
+        with os.scandir(_REPO_ROOT) as entries:
+            present = {entry.name for entry in entries if entry.is_dir()}
+    except OSError:
+        present = set()
 
-    all_good = True
     for dir_name in required_dirs:
-        if os.path.exists(dir_name):
+        if dir_name in present:
             print(f"✅ {dir_name}/ exists")
         else:
             print(f"⚠️ {dir_name}/ missing")
-            all_good = False
 
-    return all_good
+    missing = [dir_name for dir_name in required_dirs if dir_name not in present]
+    assert not missing, f"Missing directories: {', '.join(missing)}"
 
 
+@pytest.mark.integration
 def test_environment_file():
     """Test environment configuration"""
     print("\n🌍 Testing environment configuration...")
 
-    if os.path.exists(".env"):
-        print("✅ .env file exists")
-
-        # Check if it has basic structure
-        try:
-            with open(".env", "r", encoding="utf-8") as f:
-                content = f.read()
-                if "API_MODE" in content:
-                    print("✅ .env contains API_MODE")
-                else:
-                    print("⚠️ .env missing API_MODE")
-
-                if "ANTHROPIC_API_KEY" in content:
-                    print("✅ .env contains ANTHROPIC_API_KEY placeholder")
-                else:
-                    print("⚠️ .env missing ANTHROPIC_API_KEY")
-
-                return True
-        except Exception as e:
-            print(f"❌ Error reading .env: {e}")
-            return False
-    else:
-        print("❌ .env file missing")
-        return False
+    env_file = _REPO_ROOT / ".env"
+    if not env_file.exists():
+        pytest.skip(".env file missing (copy from .env.example)")
 
+    print("✅ .env file exists")
 
-if __name__ == "__main__":
-    print("=" * 60)
-    print("🚀 O-RAN × Nephio RAG System - Basic System Test")
-    print("=" * 60)
-
-    tests = [test_config_loading, test_document_loader, test_mock_mode, test_directory_structure, test_environment_file]
-
-    passed = 0
-    total = len(tests)
-
-    for test in tests:
-        try:
-            if test():
-                passed += 1
-        except Exception as e:
-            print(f"❌ Test {test.__name__} crashed: {e}")
-
-    print("\n" + "=" * 60)
-    print(f"📊 Test Results: {passed}/{total} tests passed")
-
-    if passed == total:
-        print("🎉 All basic tests passed!")
-        print("\nNext steps to make it fully functional:")
-        print("1. Install remaining dependencies:")
-        print("   pip install langchain-anthropic sentence-transformers chromadb")
-        print("2. Set up API key in .env file:")
-        print("   ANTHROPIC_API_KEY=your-actual-api-key")
-        print("3. Try running: python main.py")
+    # Check if it has basic structure; one pass over the lines, stopping once both keys are seen
+    needed = {"API_MODE", "ANTHROPIC_API_KEY"}
+    found = set()
+    with open(env_file, "r", encoding="utf-8") as f:
+        for line in f:
+            found.update(key for key in needed - found if key in line)
+            if found == needed:
+                break
+
+    if "API_MODE" in found:
+        print("✅ .env contains API_MODE")
     else:
-        print("⚠️ Some tests failed. Check the issues above.")
+        print("⚠️ .env missing API_MODE")
 
-    print("=" * 60)
+    if "ANTHROPIC_API_KEY" in found:
+        print("✅ .env contains ANTHROPIC_API_KEY placeholder")
+    else:
+        print("⚠️ .env missing ANTHROPIC_API_KEY")
+
+
+if __name__ == "__main__":
+    sys.exit(pytest.main([__file__, "-s"]))
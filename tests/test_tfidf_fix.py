@@ -10,8 +10,11 @@ The original issue was that TfidfVectorizer doesn't have these methods directly.
 """
 
 import logging
+from functools import lru_cache
 from typing import List
 
+from tests._hash_embeddings import hash_vectors
+
 logging.basicConfig(level=logging.INFO, format="%(message)s")
 
 # Try to import sklearn components directly
@@ -42,6 +45,9 @@ class SklearnTfidfEmbeddings:
         if not SKLEARN_AVAILABLE:
             raise ImportError("sklearn not available")
 
+        self._params = (max_features, stop_words, ngram_range, min_df, max_df)
+        # Returned (as a copy) for queries before fitting; sized to match the configured feature count
+        self._unfitted_query = (0.0,) * max_features
         self.vectorizer = TfidfVectorizer(
             max_features=max_features, stop_words=stop_words, ngram_range=ngram_range, min_df=min_df, max_df=max_df
         )
@@ -49,6 +55,16 @@ class SklearnTfidfEmbeddings:
         self._document_vectors = None
         print(f"TF-IDF embedding wrapper initialized (max_features={max_features})")
 
+    @classmethod
+    @lru_cache(maxsize=8)
+    def _fit_cached(cls, texts: tuple, params: tuple) -> "TfidfVectorizer":
+        """Fit a vectorizer once per (corpus, parameters); wrappers fitted on the same input share it read-only"""
+        max_features, stop_words, ngram_range, min_df, max_df = params
+        vectorizer = TfidfVectorizer(
+            max_features=max_features, stop_words=stop_words, ngram_range=ngram_range, min_df=min_df, max_df=max_df
+        )
+        return vectorizer.fit(texts)
+
     def embed_documents(self, texts: List[str]) -> List[List[float]]:
         """Create TF-IDF vector representations for documents"""
         if not texts:
@@ -57,24 +73,23 @@ class SklearnTfidfEmbeddings:
         # Fit the vectorizer if not already fitted
         if not self._fitted:
             print(f"Fitting TF-IDF vectorizer with {len(texts)} documents...")
-            self.vectorizer.fit(texts)
+            self.vectorizer = self._fit_cached(tuple(texts), self._params)
             self._fitted = True
             print("TF-IDF vectorizer fitted successfully")
 
         # Transform documents to vectors
         tfidf_matrix = self.vectorizer.transform(texts)
-        dense_matrix = tfidf_matrix.toarray()
-        embeddings = [row.tolist() for row in dense_matrix]
 
-        self._document_vectors = embeddings
-        print(f"Generated {len(embeddings)} TF-IDF vectors (dimension: {len(embeddings[0]) if embeddings else 0})")
-        return embeddings
+        # Keep the sparse matrix; densify the whole batch in one C-level tolist() for the caller
+        self._document_vectors = tfidf_matrix
+        print(f"Generated {tfidf_matrix.shape[0]} TF-IDF vectors (dimension: {tfidf_matrix.shape[1]})")
+        return tfidf_matrix.toarray().tolist()
 
     def embed_query(self, text: str) -> List[float]:
         """Create TF-IDF vector representation for a query"""
         if not self._fitted:
             print("WARNING: TF-IDF vectorizer not fitted, cannot process query")
-            return [0.0] * 5000
+            return list(self._unfitted_query)
 
         query_vector = self.vectorizer.transform([text])
         dense_vector = query_vector.toarray()[0]
@@ -89,32 +104,7 @@ class DummyEmbeddings:
 
     def embed_documents(self, texts: List[str]) -> List[List[float]]:
         """Create simple hash-based vectors for documents"""
-        embeddings = []
-        for text in texts:
-            import hashlib
-
-            text_bytes = text.encode("utf-8")
-            hash_obj = hashlib.md5(text_bytes)
-            hash_hex = hash_obj.hexdigest()
-
-            vector = []
-            for i in range(0, min(len(hash_hex), self.dimension // 16)):
-                try:
-                    hex_pair = (
-                        hash_hex[i * 2 : i * 2 + 2] if i * 2 + 1 < len(hash_hex) else hash_hex[i * 2 : i * 2 + 1] + "0"
-                    )
-                    int_val = int(hex_pair, 16)
-                    float_val = (int_val / 128.0) - 1.0
-                    vector.append(float_val)
-                except ValueError:
-                    vector.append(0.0)
-
-            while len(vector) < self.dimension:
-                vector.append(0.0)
-            vector = vector[: self.dimension]
-            embeddings.append(vector)
-
-        return embeddings
+        return hash_vectors(texts, self.dimension)
 
     def embed_query(self, text: str) -> List[float]:
         """Create simple hash-based vector for a query"""
@@ -4,14 +4,15 @@ O-RAN × Nephio RAG 系統驗證測試腳本
 用於驗證系統的核心功能是否能正常運作
 """
 
+import asyncio
+import importlib.util
 import json
 import logging
 import os
 import sys
-from pathlib import Path
 from typing import Any, Dict
 
-# 設定測試環境
+# 設定測試環境 (由 main() 套用，避免匯入模組時影響其他測試)
 TEST_ENV = {
     "ANTHROPIC_API_KEY": "test-key-not-real",
     "VECTOR_DB_PATH": "./test_vectordb",
@@ -21,13 +22,6 @@ TEST_ENV = {
     "CLAUDE_TEMPERATURE": "0.1",
 }
 
-# 設定環境變數
-for key, value in TEST_ENV.items():
-    os.environ[key] = value
-
-# 添加 src 到 Python 路徑
-sys.path.insert(0, str(Path(__file__).parent / "src"))
-
 
 class SystemVerificationTester:
     """系統驗證測試器"""
@@ -35,6 +29,7 @@ class SystemVerificationTester:
     def __init__(self):
         self.results = {}
         self.errors = []
+        self._loop = None
         self.setup_logging()
 
     def setup_logging(self):
@@ -42,6 +37,17 @@ class SystemVerificationTester:
         logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(name)s - %(levelname)s - %(message)s")
         self.logger = logging.getLogger(__name__)
 
+    def run_async(self, coro):
+        """在共用的事件迴圈中執行協程，避免每個異步測試都重建事件迴圈"""
+        if self._loop is None or self._loop.is_closed():
+            self._loop = asyncio.new_event_loop()
+        return self._loop.run_until_complete(coro)
+
+    def close(self):
+        """關閉共用的事件迴圈"""
+        if self._loop is not None and not self._loop.is_closed():
+            self._loop.close()
+
     def test_imports(self) -> bool:
         """測試模組導入"""
         self.logger.info("🔍 測試模組導入...")
@@ -218,8 +224,6 @@ class SystemVerificationTester:
         self.logger.info("🔍 測試異步組件...")
 
         try:
-            import asyncio
-
             from async_rag_system import AsyncDocumentLoader
             from config import Config
 
@@ -230,7 +234,7 @@ class SystemVerificationTester:
                 return True
 
             # 運行異步測試
-            result = asyncio.run(test_async_loader())
+            result = self.run_async(test_async_loader())
 
             if result:
                 self.logger.info("✅ 異步組件測試成功")
@@ -287,23 +291,16 @@ class SystemVerificationTester:
             ("asyncio", "異步編程"),
         ]
 
+        # 套件名稱與導入名稱不同者
+        import_names = {"beautifulsoup4": "bs4", "python-dotenv": "dotenv"}
+
         success_count = 0
         for package, description in dependencies:
-            try:
-                if package == "asyncio":
-                    import asyncio
-                elif package == "beautifulsoup4":
-                    import bs4
-                elif package == "sentence_transformers":
-                    import sentence_transformers
-                elif package == "python-dotenv":
-                    import dotenv
-                else:
-                    __import__(package)
-
+            # 只查找模組規格而不實際導入，避免為了檢查而載入 chromadb 等重量級套件
+            if importlib.util.find_spec(import_names.get(package, package)) is not None:
                 self.logger.info(f"✅ {description} ({package}) 可用")
                 success_count += 1
-            except ImportError:
+            else:
                 self.logger.warning(f"⚠️  {description} ({package}) 不可用")
 
         self.logger.info(f"依賴檢查結果: {success_count}/{len(dependencies)} 可用")
@@ -383,8 +380,13 @@ def main():
     print("🔬 O-RAN × Nephio RAG 系統驗證測試")
     print("=" * 60)
 
+    os.environ.update(TEST_ENV)
+
     tester = SystemVerificationTester()
-    results = tester.run_all_tests()
+    try:
+        results = tester.run_all_tests()
+    finally:
+        tester.close()
 
     # 保存結果
     with open("verification_results.json", "w", encoding="utf-8") as f: